@@ -0,0 +1,297 @@
+"""
+Anti-engine search for the losing AI.
+
+A negamax/alpha-beta search with iterative deepening, move ordering and a
+Zobrist-keyed transposition table. The evaluation is the mirror image of a
+normal engine: every side is scored by how badly it is doing, so the AI
+picks lines that keep it losing even if the opponent refuses to win.
+"""
+
+import time
+
+import chess
+
+
+# ---------------------------------------------
+# Board with incremental material balance
+# ---------------------------------------------
+
+PIECE_VALUES = [0, 1, 3, 3, 5, 9, 1000]   # indexed by chess.PieceType
+
+
+class LoserBoard(chess.Board):
+    """
+    A :class:`chess.Board` that keeps the material balance (positive = White
+    advantage) up to date on push/pop, so evaluating a position does not need
+    to rescan the piece map. Only captures, promotions and drops change it.
+
+    Zobrist hash tracking is switched on as well, so transposition table
+    keys are cheap to compute.
+    """
+
+    def __init__(self, fen=chess.STARTING_FEN, *, chess960=False):
+        self.material = 0
+        self._material_stack = []
+        super().__init__(fen, chess960=chess960)
+        self.track_zobrist_hash()
+
+    def _count_material(self):
+        white = self.occupied_co[chess.WHITE]
+        black = self.occupied_co[chess.BLACK]
+        score = 0
+        for piece_type, bb in enumerate([self.pawns, self.knights, self.bishops,
+                                         self.rooks, self.queens, self.kings], 1):
+            score += PIECE_VALUES[piece_type] * (chess.popcount(bb & white) - chess.popcount(bb & black))
+        return score
+
+    def clear_stack(self):
+        # Every operation that edits pieces outside of push/pop ends up here.
+        super().clear_stack()
+        self._material_stack.clear()
+        self.material = self._count_material()
+
+    def push(self, move):
+        self._material_stack.append(self.material)
+
+        delta = 0
+        if move:
+            if move.drop:
+                delta += PIECE_VALUES[move.drop]
+            elif self.occupied_co[not self.turn] & chess.BB_SQUARES[move.to_square]:
+                delta += PIECE_VALUES[self.piece_type_at(move.to_square)]
+            elif self.is_en_passant(move):
+                delta += PIECE_VALUES[chess.PAWN]
+            if move.promotion:
+                delta += PIECE_VALUES[move.promotion] - PIECE_VALUES[chess.PAWN]
+
+        super().push(move)
+        self.material += delta if self.turn == chess.BLACK else -delta
+
+    def pop(self):
+        move = super().pop()
+        self.material = self._material_stack.pop()
+        return move
+
+    def apply_mirror(self):
+        super().apply_mirror()
+        self.material = -self.material
+
+    def copy(self, *, stack=True):
+        board = super().copy(stack=stack)
+        board.material = self.material
+        if stack:
+            stack = len(self.move_stack) if stack is True else stack
+            board._material_stack = self._material_stack[-stack:]
+        return board
+
+    def root(self):
+        board = super().root()
+        if self._material_stack:
+            board.material = self._material_stack[0]
+        return board
+
+
+# ---------------------------------------------
+# Search
+# ---------------------------------------------
+
+MATE_SCORE = 100000
+MATE_BOUND = MATE_SCORE - 1000   # scores beyond this encode a mate distance
+
+SLICE_NODES = 32   # nodes searched between yields of iter_search()
+
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+class AntiEngine:
+    """
+    Searches for the move that is worst for the side to move.
+
+    Scores are from the point of view of the side to move and count how far
+    that side is *behind*: losing material and getting checkmated are good,
+    and so is having few captures available (the opponent did not hang
+    anything). Both sides are modelled as trying to lose, which is what
+    lets alpha-beta prune: the chosen line loses against any reply.
+
+    *max_depth* bounds the iterative deepening in plies. *time_limit* is an
+    optional budget in seconds; when it runs out, the best move of the last
+    completed iteration is returned. The transposition table persists
+    between searches and is cleared once it grows beyond *tt_size* entries.
+    """
+
+    def __init__(self, max_depth=4, time_limit=None, tt_size=1_000_000):
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.tt_size = tt_size
+        self.tt = {}
+        self.nodes = 0
+        self._deadline = None
+
+    def clear(self):
+        """Forget everything stored in the transposition table."""
+        self.tt.clear()
+
+    def search(self, board):
+        """
+        Returns the worst move for the side to move on *board*, or ``None``
+        if there are no legal moves. *board* itself is not modified.
+        """
+        steps = self.iter_search(board)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    def iter_search(self, board):
+        """
+        Generator version of :meth:`search` for cooperative schedulers: it
+        yields after every root move and every SLICE_NODES nodes it has
+        searched, and finally returns the move as its ``StopIteration`` value. The time limit counts wall-clock
+        time, including the time spent outside the generator.
+        """
+        # Search a private copy without the move stack, so that bookkeeping
+        # the caller enabled (like repetition tracking) does not slow down
+        # every push and pop.
+        if isinstance(board, LoserBoard):
+            board = board.copy(stack=False)
+            board.track_repetitions(False)
+        else:
+            board = LoserBoard(board.fen())
+
+        legal_moves = list(board.legal_moves)
+        if not legal_moves:
+            return None
+
+        if len(self.tt) > self.tt_size:
+            self.tt.clear()
+
+        self.nodes = 0
+        self._deadline = None if self.time_limit is None else time.monotonic() + self.time_limit
+
+        root_key = board.zobrist_hash()
+        entry = self.tt.get(root_key)
+        tt_move = entry[3] if entry is not None else None
+
+        best_move = legal_moves[0]
+        for depth in range(1, self.max_depth + 1):
+            # Same as _negamax() with a full window, split up at the root.
+            alpha = -MATE_SCORE - 1
+            depth_best_move = None
+            try:
+                for move in self._ordered_moves(board, tt_move):
+                    board.push(move)
+                    try:
+                        value = -(yield from self._negamax(board, depth - 1, -MATE_SCORE - 1, -alpha, 1))
+                    finally:
+                        board.pop()
+
+                    if value > alpha:
+                        alpha = value
+                        depth_best_move = move
+                    yield
+            except _SearchTimeout:
+                break
+
+            best_move = tt_move = depth_best_move
+            self.tt[root_key] = (depth, TT_EXACT, alpha, best_move)
+
+            if self._deadline is not None and time.monotonic() >= self._deadline:
+                break
+
+        return best_move
+
+    def _evaluate(self, board):
+        material = board.material if board.turn == chess.WHITE else -board.material
+        return -material - board.count_legal_captures()
+
+    def _ordered_moves(self, board, tt_move):
+        def key(move):
+            if move == tt_move:
+                return -MATE_SCORE
+            # Try sacrifices of big pieces first.
+            if board.is_attacked_by(not board.turn, move.to_square):
+                return -PIECE_VALUES[board.piece_type_at(move.from_square)]
+            return 0
+
+        return sorted(board.legal_moves, key=key)
+
+    def _negamax(self, board, depth, alpha, beta, ply):
+        # A generator, so that iter_search() can yield between nodes.
+        self.nodes += 1
+        if self.nodes % SLICE_NODES == 0:
+            if self._deadline is not None and time.monotonic() >= self._deadline:
+                raise _SearchTimeout()
+            yield
+
+        if ply and (board.is_insufficient_material() or board.halfmove_clock >= 100):
+            return 0
+
+        key = board.zobrist_hash()
+        entry = self.tt.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, flag, value, tt_move = entry
+            if ply and entry_depth >= depth:
+                if value > MATE_BOUND:
+                    value -= ply
+                elif value < -MATE_BOUND:
+                    value += ply
+
+                if flag == TT_EXACT:
+                    return value
+                elif flag == TT_LOWER:
+                    alpha = max(alpha, value)
+                elif flag == TT_UPPER:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        if depth <= 0:
+            if not any(board.generate_legal_moves()):
+                return MATE_SCORE - ply if board.is_check() else 0
+            return self._evaluate(board)
+
+        moves = self._ordered_moves(board, tt_move)
+        if not moves:
+            # Getting checkmated is the best thing that can happen.
+            return MATE_SCORE - ply if board.is_check() else 0
+
+        alpha_orig = alpha
+        best_value = -MATE_SCORE - 1
+        best_move = None
+        for move in moves:
+            board.push(move)
+            try:
+                value = -(yield from self._negamax(board, depth - 1, -beta, -alpha, ply + 1))
+            finally:
+                board.pop()
+
+            if value > best_value:
+                best_value = value
+                best_move = move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= alpha_orig:
+            flag = TT_UPPER
+        elif best_value >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+
+        stored = best_value
+        if stored > MATE_BOUND:
+            stored += ply
+        elif stored < -MATE_BOUND:
+            stored -= ply
+        self.tt[key] = (depth, flag, stored, best_move)
+
+        return best_value
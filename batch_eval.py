@@ -0,0 +1,160 @@
+"""
+Batched position evaluation with NumPy.
+
+Positions are passed as an (N, 12) array of uint64 piece bitboards in
+PIECE_PLANES order, so many positions are scored with a few array
+operations instead of a Python loop per board. The score is material plus
+piece-square bonuses, in centipawns, positive = White advantage.
+
+NumPy is only needed for this module, the game itself does not use it:
+
+    pip install numpy
+"""
+
+import numpy as np
+
+import chess
+
+
+# ---------------------------------------------
+# Tables
+# ---------------------------------------------
+
+# Order of the 12 bitboards of a position
+PIECE_PLANES = [(color, piece_type) for color in (chess.WHITE, chess.BLACK) for piece_type in chess.PIECE_TYPES]
+
+# Centipawns, indexed by chess.PieceType
+PIECE_VALUES = [0, 100, 320, 330, 500, 900, 20000]
+
+# Piece-square bonuses from White's point of view, laid out as seen from
+# White's side of the board (a8 first, h1 last)
+PIECE_SQUARE_TABLES = {
+    chess.PAWN: [
+          0,   0,   0,   0,   0,   0,   0,   0,
+         50,  50,  50,  50,  50,  50,  50,  50,
+         10,  10,  20,  30,  30,  20,  10,  10,
+          5,   5,  10,  25,  25,  10,   5,   5,
+          0,   0,   0,  20,  20,   0,   0,   0,
+          5,  -5, -10,   0,   0, -10,  -5,   5,
+          5,  10,  10, -20, -20,  10,  10,   5,
+          0,   0,   0,   0,   0,   0,   0,   0,
+    ],
+    chess.KNIGHT: [
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20,   0,   0,   0,   0, -20, -40,
+        -30,   0,  10,  15,  15,  10,   0, -30,
+        -30,   5,  15,  20,  20,  15,   5, -30,
+        -30,   0,  15,  20,  20,  15,   0, -30,
+        -30,   5,  10,  15,  15,  10,   5, -30,
+        -40, -20,   0,   5,   5,   0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50,
+    ],
+    chess.BISHOP: [
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10,   0,   0,   0,   0,   0,   0, -10,
+        -10,   0,   5,  10,  10,   5,   0, -10,
+        -10,   5,   5,  10,  10,   5,   5, -10,
+        -10,   0,  10,  10,  10,  10,   0, -10,
+        -10,  10,  10,  10,  10,  10,  10, -10,
+        -10,   5,   0,   0,   0,   0,   5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20,
+    ],
+    chess.ROOK: [
+          0,   0,   0,   0,   0,   0,   0,   0,
+          5,  10,  10,  10,  10,  10,  10,   5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+          0,   0,   0,   5,   5,   0,   0,   0,
+    ],
+    chess.QUEEN: [
+        -20, -10, -10,  -5,  -5, -10, -10, -20,
+        -10,   0,   0,   0,   0,   0,   0, -10,
+        -10,   0,   5,   5,   5,   5,   0, -10,
+         -5,   0,   5,   5,   5,   5,   0,  -5,
+          0,   0,   5,   5,   5,   5,   0,  -5,
+        -10,   5,   5,   5,   5,   5,   0, -10,
+        -10,   0,   5,   0,   0,   0,   0, -10,
+        -20, -10, -10,  -5,  -5, -10, -10, -20,
+    ],
+    chess.KING: [
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+         20,  20,   0,   0,   0,   0,  20,  20,
+         20,  30,  10,   0,   0,  10,  30,  20,
+    ],
+}
+
+
+def _plane_weights():
+    # (12, 64) score of a piece on each square, signed for its color. The
+    # tables are laid out a8..h1, so White looks up square ^ 56 and Black,
+    # whose view is mirrored, looks up the square itself.
+    weights = np.zeros((len(PIECE_PLANES), 64), dtype=np.int64)
+    for plane, (color, piece_type) in enumerate(PIECE_PLANES):
+        table = np.array(PIECE_SQUARE_TABLES[piece_type], dtype=np.int64)
+        if color == chess.WHITE:
+            weights[plane] = PIECE_VALUES[piece_type] + table[np.arange(64) ^ 56]
+        else:
+            weights[plane] = -(PIECE_VALUES[piece_type] + table)
+    return weights
+
+PLANE_WEIGHTS = _plane_weights()
+
+
+# ---------------------------------------------
+# Evaluation
+# ---------------------------------------------
+
+def board_bitboards(board):
+    """The 12 piece bitboards of *board* in PIECE_PLANES order."""
+    return [board.pieces_mask(piece_type, color) for color, piece_type in PIECE_PLANES]
+
+
+def stack_bitboards(boards):
+    """Stack the bitboards of many boards into an (N, 12) uint64 array."""
+    return np.array([board_bitboards(board) for board in boards], dtype=np.uint64).reshape(-1, len(PIECE_PLANES))
+
+
+def evaluate_batch(bitboards, chunk_size=65536):
+    """
+    Score an (N, 12) array of piece bitboards. Returns an int64 array of N
+    scores in centipawns, positive = White advantage.
+
+    Positions are expanded to one byte per piece and square, so they are
+    processed *chunk_size* at a time to bound memory use.
+    """
+    bitboards = np.ascontiguousarray(bitboards, dtype='<u8').reshape(-1, len(PIECE_PLANES))
+    scores = np.empty(len(bitboards), dtype=np.int64)
+    for start in range(0, len(bitboards), chunk_size):
+        chunk = bitboards[start:start + chunk_size]
+        # Little-endian bytes with little bit order put square 0 first
+        squares = np.unpackbits(chunk.view(np.uint8).reshape(len(chunk), len(PIECE_PLANES), 8),
+                                axis=2, bitorder='little')
+        scores[start:start + len(chunk)] = np.tensordot(squares, PLANE_WEIGHTS, axes=([1, 2], [0, 1]))
+    return scores
+
+
+def evaluate_boards(boards):
+    """Score a sequence of boards, see :func:`evaluate_batch`."""
+    return evaluate_batch(stack_bitboards(boards))
+
+
+def evaluate_children(board):
+    """
+    Score the position after every legal move on *board* in one batch.
+    Returns a list of moves and an array with their scores.
+    """
+    moves = list(board.legal_moves)
+    bitboards = np.empty((len(moves), len(PIECE_PLANES)), dtype=np.uint64)
+    for i, move in enumerate(moves):
+        board.push(move)
+        bitboards[i] = board_bitboards(board)
+        board.pop()
+    return moves, evaluate_batch(bitboards)
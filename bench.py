@@ -0,0 +1,136 @@
+"""
+Perft benchmark for the move generator.
+
+Runs perft to a fixed depth on a set of standard positions for chess.Board
+and on the starting position of every class in chess.variant, and reports
+nodes per second. Results can be saved as a baseline JSON and compared
+against later runs, to catch performance regressions (and move generation
+bugs, which show up as a changed node count) before deploying a new build.
+
+    python bench.py --save baseline.json      # record a baseline
+    python bench.py --baseline baseline.json  # compare against it
+
+Exits with status 1 if a node count differs from the baseline or a position
+got slower than the baseline by more than the tolerance.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import chess
+import chess.variant
+
+
+# ---------------------------------------------
+# Positions
+# ---------------------------------------------
+
+# (name, FEN, depth) for chess.Board
+STANDARD_POSITIONS = [
+    ('start',      chess.STARTING_FEN,                                                      4),
+    ('kiwipete',   'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1', 3),
+    ('endgame',    '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',                            5),
+    ('castling',   'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',     4),
+    ('promotions', 'n1n5/PPPk4/8/8/8/8/4Kppp/5N1N b - - 0 1',                              4),
+    ('ep-pinned',  '8/8/8/2k5/2pP4/8/B7/4K3 b - d3 0 3',                                   5),
+    ('ep-check',   '8/8/1k6/2b5/2pP4/8/5K2/8 b - d3 0 1',                                  5),
+    ('ep-skewer',  '8/8/8/8/k2Pp2Q/8/8/3K4 b - d3 0 1',                                    5),
+]
+
+# Depth for the starting position of each variant, by UCI variant name
+VARIANT_DEPTHS = {'atomic': 3, 'racingkings': 3}
+VARIANT_DEPTH = 4
+
+
+def perft(board, depth):
+    if depth > 1:
+        nodes = 0
+        for move in board.generate_legal_moves():
+            board.push(move)
+            nodes += perft(board, depth - 1)
+            board.pop()
+        return nodes
+    elif depth == 1:
+        return board.legal_moves.count()
+    else:
+        return 1
+
+
+def benchmarks():
+    """All (key, board class, FEN, depth) to run."""
+    for name, fen, depth in STANDARD_POSITIONS:
+        yield f'chess/{name}', chess.Board, fen, depth
+    for cls in chess.variant.VARIANTS:
+        if cls is not chess.Board:
+            yield f'{cls.uci_variant}/start', cls, cls.starting_fen, VARIANT_DEPTHS.get(cls.uci_variant, VARIANT_DEPTH)
+
+
+# ---------------------------------------------
+# Running and reporting
+# ---------------------------------------------
+
+def run_benchmark(cls, fen, depth, repeat):
+    """Returns (nodes, best time in seconds) over *repeat* runs."""
+    best = None
+    for _ in range(repeat):
+        board = cls(fen)
+        start = time.perf_counter()
+        nodes = perft(board, depth)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return nodes, best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--baseline', help='baseline JSON to compare against')
+    parser.add_argument('--save', help='write the results as a baseline JSON')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='allowed slowdown against the baseline (default: 0.10 = 10%%)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per position, the fastest counts (default: 3)')
+    parser.add_argument('--depth-offset', type=int, default=0,
+                        help='add to every depth, e.g. -1 for a quick run (default: 0)')
+    parser.add_argument('-k', '--filter', default='', help='only run benchmarks whose name contains this')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    failed = False
+    print(f"{'benchmark':<24} {'depth':>5} {'nodes':>10} {'seconds':>8} {'knps':>8} {'baseline':>9} {'change':>8}")
+    for key, cls, fen, depth in benchmarks():
+        if args.filter not in key:
+            continue
+        depth = max(1, depth + args.depth_offset)
+        nodes, elapsed = run_benchmark(cls, fen, depth, args.repeat)
+        nps = nodes / elapsed
+        results[key] = {'fen': fen, 'depth': depth, 'nodes': nodes, 'nps': round(nps)}
+
+        line = f'{key:<24} {depth:>5} {nodes:>10} {elapsed:>8.3f} {nps / 1000:>8.1f}'
+        base = baseline.get(key)
+        if base is not None and base['depth'] == depth:
+            change = nps / base['nps'] - 1
+            line += f" {base['nps'] / 1000:>9.1f} {change:>+8.1%}"
+            if base['nodes'] != nodes:
+                line += f"  NODES DIFFER (baseline {base['nodes']})"
+                failed = True
+            elif change < -args.tolerance:
+                line += '  SLOWER'
+                failed = True
+        print(line, flush=True)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Builds the AI's opening book of losing moves from PGN game logs.
+
+For every position in the opening of every game, the move that was played
+gets a weight by how the game ended for the side that played it: by
+default 2 for a loss, 1 for a draw and nothing for a win. The result is a
+Polyglot book that main.py consults before searching, picking moves by
+weight, so the AI repeats the openings that lost most often.
+
+    python build_book.py games/*.pgn
+    python build_book.py games/*.pgn --color black --max-ply 30
+"""
+
+import argparse
+import sys
+
+import chess
+import chess.pgn
+import chess.polyglot
+
+
+DEFAULT_OUTPUT = 'assets/loser_book.bin'
+
+
+def parse_points(text):
+    points = tuple(int(part) for part in text.split(','))
+    if len(points) != 3:
+        raise argparse.ArgumentTypeError('expected three weights: win,draw,loss')
+    return points
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('pgn', nargs='+', help='PGN files to read')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help=f'book to write (default: {DEFAULT_OUTPUT})')
+    parser.add_argument('--max-ply', type=int, default=24, help='half-moves per game to use (default: 24)')
+    parser.add_argument('--color', choices=['white', 'black'], help='only use the moves of this side (default: both)')
+    parser.add_argument('--points', type=parse_points, default=(0, 1, 2),
+                        help='weights for a win, draw and loss of the side to move (default: 0,1,2)')
+    args = parser.parse_args(argv)
+
+    color = None if args.color is None else args.color == 'white'
+
+    builder = chess.polyglot.BookBuilder()
+    games = moves = 0
+    for path in args.pgn:
+        with open(path, encoding='utf-8-sig') as pgn:
+            while True:
+                game = chess.pgn.read_game(pgn)
+                if game is None:
+                    break
+                games += 1
+                moves += builder.add_game(game, max_ply=args.max_ply, color=color, points=args.points)
+
+    entries = builder.write(args.output)
+    print(f'{games} games, {moves} moves, {entries} entries written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,20 +13,25 @@ __email__ = "niklas.fiekas@backscattering.de"
 
 __version__ = "1.11.2"
 
+import array
 import collections
-import copy
 import dataclasses
 import enum
 import math
+import os
 import re
 import itertools
+import sys
 import typing
+import zlib
 
 from typing import ClassVar, Callable, Counter, Dict, Generic, Hashable, Iterable, Iterator, List, Literal, Mapping, Optional, SupportsInt, Tuple, Type, TypeVar, Union
 
 if typing.TYPE_CHECKING:
     from typing_extensions import Self, TypeAlias
 
+    import chess.polyglot
+
 
 EnPassantSpec = Literal["legal", "fen", "xfen"]
 
@@ -157,6 +162,33 @@ class Outcome:
         return "1/2-1/2" if self.winner is None else ("1-0" if self.winner else "0-1")
 
 
+@dataclasses.dataclass(frozen=True)
+class GameStatus:
+    """
+    Information about the state of the game in a position, obtained from
+    :func:`chess.Board.game_status()`.
+    """
+
+    legal_move_count: int
+    """The number of legal moves of the side to move."""
+
+    is_check: bool
+    """See :func:`chess.Board.is_check()`."""
+
+    is_checkmate: bool
+    """See :func:`chess.Board.is_checkmate()`."""
+
+    is_stalemate: bool
+    """See :func:`chess.Board.is_stalemate()`."""
+
+    outcome: Optional[Outcome]
+    """See :func:`chess.Board.outcome()`."""
+
+    def is_game_over(self) -> bool:
+        """Checks if :data:`~chess.GameStatus.outcome` is set."""
+        return self.outcome is not None
+
+
 class InvalidMoveError(ValueError):
     """Raised when move notation is not syntactically valid"""
 
@@ -547,11 +579,6 @@ def _attack_table(deltas: List[int]) -> Tuple[List[Bitboard], List[Dict[Bitboard
 
     return mask_table, attack_table
 
-BB_DIAG_MASKS, BB_DIAG_ATTACKS = _attack_table([-9, -7, 7, 9])
-BB_FILE_MASKS, BB_FILE_ATTACKS = _attack_table([-8, 8])
-BB_RANK_MASKS, BB_RANK_ATTACKS = _attack_table([-1, 1])
-
-
 def _rays() -> List[List[Bitboard]]:
     rays: List[List[Bitboard]] = []
     for a, bb_a in enumerate(BB_SQUARES):
@@ -568,7 +595,73 @@ def _rays() -> List[List[Bitboard]]:
         rays.append(rays_row)
     return rays
 
-BB_RAYS = _rays()
+
+# The slider attack tables and rays take a while to generate in pure Python,
+# so a serialized copy is shipped alongside this module and bulk-loaded at
+# import. It is a zlib-compressed array of little-endian 64-bit words: a
+# header, then for the diagonal, file and rank tables the 64 masks followed by
+# each square's subsets and attacks (in carry-rippler order), then the rays.
+# Regenerate it with _write_attack_tables() after changing the generators.
+_ATTACK_TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "attacks.bin")
+_ATTACK_TABLES_HEADER = [0x6b63617474617363, 1]  # b"csattack", format version
+
+_AttackTables = Tuple[List[Bitboard], List[Dict[Bitboard, Bitboard]]]
+
+def _generate_attack_tables() -> Tuple[_AttackTables, _AttackTables, _AttackTables]:
+    return _attack_table([-9, -7, 7, 9]), _attack_table([-8, 8]), _attack_table([-1, 1])
+
+def _write_attack_tables(path: str = _ATTACK_TABLES_PATH) -> None:
+    words = array.array("Q", _ATTACK_TABLES_HEADER)
+    for mask_table, attack_table in _generate_attack_tables():
+        words.extend(mask_table)
+        for attacks in attack_table:
+            words.extend(attacks.keys())
+            words.extend(attacks.values())
+    words.extend(itertools.chain.from_iterable(_rays()))
+
+    if sys.byteorder == "big":
+        words.byteswap()
+    with open(path, "wb") as f:
+        f.write(zlib.compress(words.tobytes(), 9))
+
+def _load_attack_tables(path: str = _ATTACK_TABLES_PATH) -> Optional[Tuple[_AttackTables, _AttackTables, _AttackTables, List[List[Bitboard]]]]:
+    try:
+        with open(path, "rb") as f:
+            words = array.array("Q", zlib.decompress(f.read()))
+    except (OSError, ValueError, zlib.error):
+        return None
+    if sys.byteorder == "big":
+        words.byteswap()
+
+    header_len = len(_ATTACK_TABLES_HEADER)
+    if words[:header_len].tolist() != _ATTACK_TABLES_HEADER:
+        return None
+    offset = header_len
+
+    tables = []
+    for _ in range(3):
+        mask_table = words[offset:offset + 64].tolist()
+        offset += 64
+        attack_table = []
+        for mask in mask_table:
+            n = 1 << popcount(mask)
+            attack_table.append(dict(zip(words[offset:offset + n].tolist(), words[offset + n:offset + 2 * n].tolist())))
+            offset += 2 * n
+        tables.append((mask_table, attack_table))
+
+    rays = [words[offset + 64 * a:offset + 64 * (a + 1)].tolist() for a in SQUARES]
+    if offset + 64 * 64 != len(words):
+        return None
+
+    return tables[0], tables[1], tables[2], rays
+
+_attack_tables = _load_attack_tables()
+if _attack_tables is not None:
+    (BB_DIAG_MASKS, BB_DIAG_ATTACKS), (BB_FILE_MASKS, BB_FILE_ATTACKS), (BB_RANK_MASKS, BB_RANK_ATTACKS), BB_RAYS = _attack_tables
+else:
+    (BB_DIAG_MASKS, BB_DIAG_ATTACKS), (BB_FILE_MASKS, BB_FILE_ATTACKS), (BB_RANK_MASKS, BB_RANK_ATTACKS) = _generate_attack_tables()
+    BB_RAYS = _rays()
+del _attack_tables
 
 def ray(a: Square, b: Square) -> Bitboard:
     return BB_RAYS[a][b]
@@ -578,6 +671,13 @@ def between(a: Square, b: Square) -> Bitboard:
     return bb & (bb - 1)
 
 
+# Bytes with 1 for each set bit of a byte, least significant bit first.
+_BYTE_SQUARES = [bytes((byte >> shift) & 1 for shift in range(8)) for byte in range(256)]
+
+PLANE_COUNT = 12
+"""Number of planes written by :func:`BaseBoard.write_planes() <chess.BaseBoard.write_planes()>`."""
+
+
 SAN_REGEX = re.compile(r"^([NBKRQ])?([a-h])?([1-8])?[\-x]?([a-h][1-8])(=?[nbrqkNBRQK])?[\+#]?\Z")
 
 FEN_CASTLING_REGEX = re.compile(r"^(?:-|[KQABCDEFGH]{0,2}[kqabcdefgh]{0,2})\Z")
@@ -904,23 +1004,25 @@ class BaseBoard:
 
     def attackers_mask(self, color: Color, square: Square, occupied: Optional[Bitboard] = None) -> Bitboard:
         occupied = self.occupied if occupied is None else occupied
-
-        rank_pieces = BB_RANK_MASKS[square] & occupied
-        file_pieces = BB_FILE_MASKS[square] & occupied
-        diag_pieces = BB_DIAG_MASKS[square] & occupied
-
-        queens_and_rooks = self.queens | self.rooks
-        queens_and_bishops = self.queens | self.bishops
+        ours = self.occupied_co[color]
 
         attackers = (
             (BB_KING_ATTACKS[square] & self.kings) |
             (BB_KNIGHT_ATTACKS[square] & self.knights) |
-            (BB_RANK_ATTACKS[square][rank_pieces] & queens_and_rooks) |
-            (BB_FILE_ATTACKS[square][file_pieces] & queens_and_rooks) |
-            (BB_DIAG_ATTACKS[square][diag_pieces] & queens_and_bishops) |
-            (BB_PAWN_ATTACKS[not color][square] & self.pawns))
+            (BB_PAWN_ATTACKS[not color][square] & self.pawns)) & ours
 
-        return attackers & self.occupied_co[color]
+        # Only look up slider attacks if there are sliders that could use them.
+        queens_and_rooks = (self.queens | self.rooks) & ours
+        if queens_and_rooks:
+            attackers |= (
+                (BB_RANK_ATTACKS[square][BB_RANK_MASKS[square] & occupied] |
+                 BB_FILE_ATTACKS[square][BB_FILE_MASKS[square] & occupied]) & queens_and_rooks)
+
+        queens_and_bishops = (self.queens | self.bishops) & ours
+        if queens_and_bishops:
+            attackers |= BB_DIAG_ATTACKS[square][BB_DIAG_MASKS[square] & occupied] & queens_and_bishops
+
+        return attackers
 
     def is_attacked_by(self, color: Color, square: Square, occupied: Optional[IntoSquareSet] = None) -> bool:
         """
@@ -1194,6 +1296,43 @@ class BaseBoard:
             result[square] = typing.cast(Piece, self.piece_at(square))
         return result
 
+    def write_planes(self, buffer: typing.Any, offset: int = 0) -> None:
+        """
+        Writes the pieces into *buffer* as 8x8x12 planes with one byte per
+        entry: 1 where there is a piece and 0 elsewhere.
+
+        The 768 bytes start at byte *offset* and are indexed by
+        ``square * 12 + plane``. The planes are the piece types
+        (:data:`~chess.PAWN` to :data:`~chess.KING`) of White, followed by
+        those of Black. A NumPy array of shape ``(8, 8, 12)`` is therefore
+        indexed by rank, file and plane.
+
+        *buffer* can be any writable C-contiguous buffer with byte-sized
+        items, like a :class:`bytearray`, an ``array.array("B")`` or a NumPy
+        array of ``uint8`` or ``bool``. See :func:`chess.write_planes()` for
+        many boards.
+
+        :raises: :exc:`ValueError` if the planes do not fit into *buffer*.
+
+        >>> import chess
+        >>>
+        >>> board = chess.Board()
+        >>> planes = bytearray(8 * 8 * chess.PLANE_COUNT)
+        >>> board.write_planes(planes)
+        >>> planes[chess.E1 * chess.PLANE_COUNT + chess.KING - 1]
+        1
+        """
+        view = memoryview(buffer).cast("B")
+        end = offset + 64 * PLANE_COUNT
+        if offset < 0 or end > len(view):
+            raise ValueError(f"planes at offset {offset} do not fit into buffer of {len(view)} bytes")
+
+        plane = offset
+        for occupied in self.occupied_co[WHITE], self.occupied_co[BLACK]:
+            for bb in self.pawns, self.knights, self.bishops, self.rooks, self.queens, self.kings:
+                view[plane:end:PLANE_COUNT] = b"".join([_BYTE_SQUARES[byte] for byte in (bb & occupied).to_bytes(8, "little")])
+                plane += 1
+
     def _set_piece_map(self, pieces: Mapping[Square, Piece]) -> None:
         self._clear_board()
         for square, piece in pieces.items():
@@ -1540,10 +1679,36 @@ class BaseBoard:
         return board
 
 
+def write_planes(boards: Iterable[BaseBoard], buffer: typing.Any) -> int:
+    """
+    Writes the planes of many boards back to back into *buffer*, for example
+    a NumPy array of shape ``(len(boards), 8, 8, 12)``. See
+    :func:`BaseBoard.write_planes() <chess.BaseBoard.write_planes()>`
+    for the layout.
+
+    Returns the number of boards written.
+
+    :raises: :exc:`ValueError` if the boards do not fit into *buffer*.
+    """
+    view = memoryview(buffer).cast("B")
+    count = 0
+    for board in boards:
+        board.write_planes(view, count * 64 * PLANE_COUNT)
+        count += 1
+    return count
+
+
 BoardT = TypeVar("BoardT", bound="Board")
 
 class _BoardState:
 
+    __slots__ = (
+        "pawns", "knights", "bishops", "rooks", "queens", "kings",
+        "occupied_w", "occupied_b", "occupied", "promoted",
+        "turn", "castling_rights", "ep_square", "halfmove_clock", "fullmove_number",
+        "zobrist_board", "game_status", "legal_move_cache", "repetition",
+    )
+
     def __init__(self, board: Board) -> None:
         self.pawns = board.pawns
         self.knights = board.knights
@@ -1564,6 +1729,13 @@ class _BoardState:
         self.halfmove_clock = board.halfmove_clock
         self.fullmove_number = board.fullmove_number
 
+        self.zobrist_board = board._zobrist_board
+        self.game_status = board._game_status
+        self.legal_move_cache = board._legal_move_cache
+
+        # Repetition table entry (key, irreversible) of this position.
+        self.repetition: Optional[Tuple[Hashable, bool]] = None
+
     def restore(self, board: Board) -> None:
         board.pawns = self.pawns
         board.knights = self.knights
@@ -1584,6 +1756,28 @@ class _BoardState:
         board.halfmove_clock = self.halfmove_clock
         board.fullmove_number = self.fullmove_number
 
+        board._zobrist_board = self.zobrist_board if board._zobrist_hasher is not None else None
+        board._game_status = self.game_status
+        board._legal_move_cache = self.legal_move_cache
+
+    def piece_type_at(self, square: Square) -> Optional[PieceType]:
+        mask = BB_SQUARES[square]
+
+        if not self.occupied & mask:
+            return None
+        elif self.pawns & mask:
+            return PAWN
+        elif self.knights & mask:
+            return KNIGHT
+        elif self.bishops & mask:
+            return BISHOP
+        elif self.rooks & mask:
+            return ROOK
+        elif self.queens & mask:
+            return QUEEN
+        else:
+            return KING
+
 class Board(BaseBoard):
     """
     A :class:`~chess.BaseBoard`, additional information representing
@@ -1699,6 +1893,12 @@ class Board(BaseBoard):
 
         self.chess960 = chess960
 
+        self._zobrist_hasher: Optional[chess.polyglot.ZobristHasher] = None
+        self._zobrist_board: Optional[int] = None
+        self._repetitions: Optional[List[Counter[Hashable]]] = None
+        self._game_status: Optional[Tuple[Hashable, GameStatus]] = None
+        self._legal_move_cache: Optional[Tuple[Hashable, Tuple[Move, ...], Dict[Square, Tuple[Move, ...]]]] = None
+
         self.ep_square = None
         self.move_stack = []
         self._stack: List[_BoardState] = []
@@ -1745,6 +1945,57 @@ class Board(BaseBoard):
         """
         return PseudoLegalMoveGenerator(self)
 
+    def cached_legal_moves(self) -> Tuple[Move, ...]:
+        """
+        Gets the legal moves as a tuple that is generated once per position
+        and reused until it changes.
+
+        The cache lives with the position: :func:`~chess.Board.push()` and
+        methods that clear the move stack invalidate it, and
+        :func:`~chess.Board.pop()` brings back the moves of the previous
+        position. Use :data:`~chess.Board.legal_moves` for a dynamic list.
+
+        >>> import chess
+        >>>
+        >>> board = chess.Board()
+        >>> len(board.cached_legal_moves())
+        20
+        """
+        return self._cached_legal_moves()[0]
+
+    def cached_legal_moves_from(self, square: Square) -> Tuple[Move, ...]:
+        """
+        Gets the legal moves starting on the given square. Shares the cache
+        of :func:`~chess.Board.cached_legal_moves()`.
+
+        >>> import chess
+        >>>
+        >>> board = chess.Board()
+        >>> board.cached_legal_moves_from(chess.G1)
+        (Move.from_uci('g1h3'), Move.from_uci('g1f3'))
+        """
+        return self._cached_legal_moves()[1].get(square, ())
+
+    def _cached_legal_moves(self) -> Tuple[Tuple[Move, ...], Dict[Square, Tuple[Move, ...]]]:
+        # Also guard against the properties that may be set directly.
+        key = (self.turn, self.castling_rights, self.ep_square, self._variant_state_key())
+        if self._legal_move_cache is not None and self._legal_move_cache[0] == key:
+            return self._legal_move_cache[1], self._legal_move_cache[2]
+
+        moves = tuple(self.generate_legal_moves())
+        by_square: Dict[Square, List[Move]] = {}
+        for move in moves:
+            by_square.setdefault(move.from_square, []).append(move)
+
+        self._legal_move_cache = key, moves, {square: tuple(square_moves) for square, square_moves in by_square.items()}
+        return self._legal_move_cache[1], self._legal_move_cache[2]
+
+    def _variant_state_key(self) -> Hashable:
+        # State beyond the pieces that variants keep in mutable attributes,
+        # like pockets or remaining checks, so that changing it in place
+        # invalidates the cached results of the position.
+        return None
+
     def reset(self) -> None:
         """Restores the starting position."""
         self.turn = WHITE
@@ -1785,16 +2036,155 @@ class Board(BaseBoard):
         """Clears the move stack."""
         self.move_stack.clear()
         self._stack.clear()
+        self._zobrist_board = None
+        self._game_status = None
+        self._legal_move_cache = None
+        if self._repetitions is not None:
+            self._repetitions = [collections.Counter()]
 
     def root(self) -> Self:
         """Returns a copy of the root position."""
         if self._stack:
             board = type(self)(None, chess960=self.chess960)
             self._stack[0].restore(board)
+            board._zobrist_hasher = self._zobrist_hasher
+            if self._repetitions is not None:
+                board._repetitions = [collections.Counter()]
             return board
         else:
             return self.copy(stack=False)
 
+    def track_zobrist_hash(self, enabled: bool = True) -> None:
+        """
+        Opts in to (or out of) maintaining the piece part of the Polyglot
+        Zobrist hash incrementally.
+
+        While enabled, :func:`~chess.Board.push()` updates the key from the
+        squares that changed and :func:`~chess.Board.pop()` restores it, so
+        :func:`~chess.Board.zobrist_hash()` and
+        :func:`chess.polyglot.zobrist_hash()` no longer scan all pieces.
+        The setting is inherited by copies of the board.
+
+        >>> import chess
+        >>>
+        >>> board = chess.Board()
+        >>> board.track_zobrist_hash()
+        >>> hex(board.zobrist_hash())
+        '0x463b96181691fc9c'
+
+        Tracking can be turned off at any point of the game:
+
+        >>> board.push_san("e4")
+        Move.from_uci('e2e4')
+        >>> board.track_zobrist_hash(False)
+        >>> board.pop()
+        Move.from_uci('e2e4')
+        >>> board.push_san("d4")
+        Move.from_uci('d2d4')
+        """
+        if enabled:
+            import chess.polyglot
+            self._zobrist_hasher = chess.polyglot.POLYGLOT_HASHER
+        else:
+            self._zobrist_hasher = None
+            self._repetitions = None
+        self._zobrist_board = None
+
+    def track_repetitions(self, enabled: bool = True) -> None:
+        """
+        Opts in to (or out of) maintaining a table of position counts on
+        :func:`~chess.Board.push()` and :func:`~chess.Board.pop()`.
+
+        While enabled, :func:`~chess.Board.is_repetition()` and
+        :func:`~chess.Board.can_claim_threefold_repetition()` look positions
+        up in the table instead of replaying the game. Positions are keyed by
+        their Zobrist hash, so this also enables
+        :func:`~chess.Board.track_zobrist_hash()`. The setting is inherited
+        by copies of the board.
+
+        Enabling replays the current move stack once.
+        """
+        if not enabled:
+            self._repetitions = None
+            return
+
+        if self._zobrist_hasher is None:
+            self.track_zobrist_hash()
+
+        switchyard: List[Move] = []
+        self._repetitions = None
+        while self.move_stack:
+            switchyard.append(self.pop())
+
+        self._repetitions = [collections.Counter()]
+        while switchyard:
+            self.push(switchyard.pop())
+
+    def zobrist_hash(self) -> int:
+        """
+        Calculates the Polyglot Zobrist hash of the position. See
+        :func:`chess.polyglot.zobrist_hash()` and
+        :func:`~chess.Board.track_zobrist_hash()`.
+        """
+        import chess.polyglot
+        return chess.polyglot.zobrist_hash(self)
+
+    def _zobrist_board_hash(self) -> int:
+        assert self._zobrist_hasher is not None, "expected zobrist hash tracking to be enabled"
+        if self._zobrist_board is None:
+            self._zobrist_board = self._zobrist_hasher.hash_board(self)
+        return self._zobrist_board
+
+    def _update_zobrist_board(self, state: _BoardState) -> None:
+        assert self._zobrist_hasher is not None and self._zobrist_board is not None
+        array = self._zobrist_hasher.array
+        zobrist_board = self._zobrist_board
+
+        changed = ((state.occupied_w ^ self.occupied_co[WHITE]) | (state.occupied_b ^ self.occupied_co[BLACK]) |
+                   (state.pawns ^ self.pawns) | (state.knights ^ self.knights) | (state.bishops ^ self.bishops) |
+                   (state.rooks ^ self.rooks) | (state.queens ^ self.queens) | (state.kings ^ self.kings))
+
+        for square in scan_reversed(changed):
+            piece_type = state.piece_type_at(square)
+            if piece_type:
+                pivot = 1 if state.occupied_w & BB_SQUARES[square] else 0
+                zobrist_board ^= array[64 * ((piece_type - 1) * 2 + pivot) + square]
+
+            piece_type = self.piece_type_at(square)
+            if piece_type:
+                pivot = 1 if self.occupied_co[WHITE] & BB_SQUARES[square] else 0
+                zobrist_board ^= array[64 * ((piece_type - 1) * 2 + pivot) + square]
+
+        self._zobrist_board = zobrist_board
+
+    def _repetition_key(self) -> Hashable:
+        # Positions are only compared with positions since the last
+        # irreversible move, so castling rights are the same and there is
+        # no legal en passant capture. Only pieces and turn need hashing.
+        assert self._zobrist_hasher is not None, "expected zobrist hash tracking to be enabled"
+        return self._zobrist_board_hash() ^ self._zobrist_hasher.hash_turn(self)
+
+    def _push_repetition(self, move: Move) -> Tuple[Hashable, bool]:
+        repetitions = self._repetitions
+        assert repetitions is not None
+
+        # Some variants push and pop to test for irreversible moves. These
+        # must not be counted.
+        self._repetitions = None
+        try:
+            key = self._repetition_key()
+            irreversible = self.is_irreversible(move)
+        finally:
+            self._repetitions = repetitions
+
+        # Only positions since the last irreversible move can repeat.
+        if irreversible:
+            repetitions.append(collections.Counter())
+        else:
+            repetitions[-1][key] += 1
+
+        return key, irreversible
+
     def ply(self) -> int:
         """
         Returns the number of half-moves since the start of the game, as
@@ -1819,11 +2209,29 @@ class Board(BaseBoard):
     def generate_pseudo_legal_moves(self, from_mask: Bitboard = BB_ALL, to_mask: Bitboard = BB_ALL) -> Iterator[Move]:
         our_pieces = self.occupied_co[self.turn]
 
-        # Generate piece moves.
+        # Generate piece moves. Same as attacks_mask(), but without looking
+        # up the piece type of every square from scratch.
         non_pawns = our_pieces & ~self.pawns & from_mask
+        targets = ~our_pieces & to_mask
+        occupied = self.occupied
+        knights = self.knights
+        kings = self.kings
+        diagonal_sliders = self.bishops | self.queens
+        straight_sliders = self.rooks | self.queens
         for from_square in scan_reversed(non_pawns):
-            moves = self.attacks_mask(from_square) & ~our_pieces & to_mask
-            for to_square in scan_reversed(moves):
+            bb_square = BB_SQUARES[from_square]
+            if bb_square & knights:
+                moves = BB_KNIGHT_ATTACKS[from_square]
+            elif bb_square & kings:
+                moves = BB_KING_ATTACKS[from_square]
+            else:
+                moves = 0
+                if bb_square & diagonal_sliders:
+                    moves = BB_DIAG_ATTACKS[from_square][BB_DIAG_MASKS[from_square] & occupied]
+                if bb_square & straight_sliders:
+                    moves |= (BB_RANK_ATTACKS[from_square][BB_RANK_MASKS[from_square] & occupied] |
+                              BB_FILE_ATTACKS[from_square][BB_FILE_MASKS[from_square] & occupied])
+            for to_square in scan_reversed(moves & targets):
                 yield Move(from_square, to_square)
 
         # Generate castling moves.
@@ -2090,6 +2498,63 @@ class Board(BaseBoard):
 
         return None
 
+    def game_status(self, *, claim_draw: bool = False) -> GameStatus:
+        """
+        Gets checkmate, stalemate, the :func:`~chess.Board.outcome()` and the
+        number of legal moves at once, generating legal moves only once.
+
+        The result is cached with the position: :func:`~chess.Board.push()`
+        and methods that clear the move stack invalidate it, and
+        :func:`~chess.Board.pop()` brings back the cached status of the
+        previous position.
+
+        >>> import chess
+        >>>
+        >>> board = chess.Board("rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3")
+        >>> status = board.game_status()
+        >>> status.is_checkmate
+        True
+        >>> status.outcome
+        Outcome(termination=<Termination.CHECKMATE: 1>, winner=False)
+        """
+        # Also guard against the properties that may be set directly.
+        key = (claim_draw, self.turn, self.castling_rights, self.ep_square, self.halfmove_clock, self._variant_state_key())
+        if self._game_status is not None and self._game_status[0] == key:
+            return self._game_status[1]
+
+        legal_move_count = len(self.cached_legal_moves())
+        is_check = self.is_check()
+        is_checkmate = is_check and not legal_move_count
+        is_stalemate = not is_check and not legal_move_count and not self.is_variant_end()
+
+        # Same order as outcome().
+        outcome: Optional[Outcome] = None
+        if self.is_variant_loss():
+            outcome = Outcome(Termination.VARIANT_LOSS, not self.turn)
+        elif self.is_variant_win():
+            outcome = Outcome(Termination.VARIANT_WIN, self.turn)
+        elif self.is_variant_draw():
+            outcome = Outcome(Termination.VARIANT_DRAW, None)
+        elif is_checkmate:
+            outcome = Outcome(Termination.CHECKMATE, not self.turn)
+        elif self.is_insufficient_material():
+            outcome = Outcome(Termination.INSUFFICIENT_MATERIAL, None)
+        elif not legal_move_count:
+            outcome = Outcome(Termination.STALEMATE, None)
+        elif self.halfmove_clock >= 150 and self.is_seventyfive_moves():
+            outcome = Outcome(Termination.SEVENTYFIVE_MOVES, None)
+        elif self.is_fivefold_repetition():
+            outcome = Outcome(Termination.FIVEFOLD_REPETITION, None)
+        elif claim_draw:
+            if self.halfmove_clock >= 99 and self.can_claim_fifty_moves():
+                outcome = Outcome(Termination.FIFTY_MOVES, None)
+            elif self.can_claim_threefold_repetition():
+                outcome = Outcome(Termination.THREEFOLD_REPETITION, None)
+
+        status = GameStatus(legal_move_count, is_check, is_checkmate, is_stalemate, outcome)
+        self._game_status = key, status
+        return status
+
     def is_checkmate(self) -> bool:
         """Checks if the current position is a checkmate."""
         if not self.is_check():
@@ -2220,8 +2685,31 @@ class Board(BaseBoard):
 
         Note that checking this can be slow: In the worst case
         scenario, every legal move has to be tested and the entire game has to
-        be replayed because there is no incremental transposition table.
+        be replayed, unless :func:`~chess.Board.track_repetitions()` is
+        enabled.
         """
+        if self._repetitions is not None:
+            counts = self._repetitions[-1]
+
+            # Threefold repetition occurred.
+            if counts[self._repetition_key()] >= 2:
+                return True
+
+            # The next legal move can only be a threefold repetition if a
+            # position already occurred twice.
+            if not any(count >= 2 for count in counts.values()):
+                return False
+
+            for move in self.generate_legal_moves():
+                self.push(move)
+                try:
+                    if self._repetitions[-1][self._repetition_key()] >= 2:
+                        return True
+                finally:
+                    self.pop()
+
+            return False
+
         transposition_key = self._transposition_key()
         transpositions: Counter[Hashable] = collections.Counter()
         transpositions.update((transposition_key, ))
@@ -2265,9 +2753,12 @@ class Board(BaseBoard):
         move.
 
         Note that checking this can be slow: In the worst case, the entire
-        game has to be replayed because there is no incremental transposition
-        table.
+        game has to be replayed, unless
+        :func:`~chess.Board.track_repetitions()` is enabled.
         """
+        if self._repetitions is not None:
+            return 1 + self._repetitions[-1][self._repetition_key()] >= count
+
         # Fast check, based on occupancy only.
         maybe_repetitions = 1
         for state in reversed(self._stack):
@@ -2331,8 +2822,12 @@ class Board(BaseBoard):
             a null move.
         """
         # Push move and remember board state.
+        repetition = self._push_repetition(move) if self._repetitions is not None else None
         move = self._to_chess960(move)
         board_state = _BoardState(self)
+        board_state.repetition = repetition
+        self._game_status = None
+        self._legal_move_cache = None
         self.castling_rights = self.clean_castling_rights()  # Before pushing stack
         self.move_stack.append(self._from_chess960(self.chess960, move.from_square, move.to_square, move.promotion, move.drop))
         self._stack.append(board_state)
@@ -2354,6 +2849,8 @@ class Board(BaseBoard):
         # Drops.
         if move.drop:
             self._set_piece_at(move.to_square, move.drop, self.turn)
+            if self._zobrist_hasher is not None and self._zobrist_board is not None:
+                self._update_zobrist_board(board_state)
             self.turn = not self.turn
             return
 
@@ -2425,6 +2922,10 @@ class Board(BaseBoard):
             if captured_piece_type:
                 self._push_capture(move, capture_square, captured_piece_type, was_promoted)
 
+        # Update the incrementally tracked Zobrist hash.
+        if self._zobrist_hasher is not None and self._zobrist_board is not None:
+            self._update_zobrist_board(board_state)
+
         # Swap turn.
         self.turn = not self.turn
 
@@ -2435,7 +2936,16 @@ class Board(BaseBoard):
         :raises: :exc:`IndexError` if the move stack is empty.
         """
         move = self.move_stack.pop()
-        self._stack.pop().restore(self)
+        board_state = self._stack.pop()
+        board_state.restore(self)
+
+        if self._repetitions is not None and board_state.repetition is not None:
+            key, irreversible = board_state.repetition
+            if irreversible:
+                self._repetitions.pop()
+            else:
+                self._repetitions[-1][key] -= 1
+
         return move
 
     def peek(self) -> Move:
@@ -3732,6 +4242,71 @@ class Board(BaseBoard):
             self.generate_legal_moves(from_mask, to_mask & self.occupied_co[not self.turn]),
             self.generate_legal_ep(from_mask, to_mask))
 
+    def count_legal_captures(self, from_mask: Bitboard = BB_ALL, to_mask: Bitboard = BB_ALL) -> int:
+        """
+        Counts the legal captures of the side to move, including en passant.
+
+        Equivalent to ``len(list(board.generate_legal_captures()))`` (so
+        capturing promotions count once per promotion piece), but works on
+        the attack masks directly instead of generating and validating
+        :class:`~chess.Move` objects.
+        """
+        if self.is_variant_end():
+            return 0
+
+        them = self.occupied_co[not self.turn] & to_mask
+        our_pieces = self.occupied_co[self.turn] & from_mask
+        count = 0
+
+        king_mask = self.kings & self.occupied_co[self.turn]
+        if king_mask:
+            king = msb(king_mask)
+            blockers = self._slider_blockers(king)
+            checkers = self.attackers_mask(not self.turn, king)
+        else:
+            king = None
+            blockers = BB_EMPTY
+            checkers = BB_EMPTY
+
+        if king is not None and BB_SQUARES[king] & from_mask:
+            attacked = BB_EMPTY
+            for checker in scan_reversed(checkers & (self.bishops | self.rooks | self.queens)):
+                attacked |= ray(king, checker) & ~BB_SQUARES[checker]
+
+            for to_square in scan_reversed(BB_KING_ATTACKS[king] & them & ~attacked):
+                if not self.is_attacked_by(not self.turn, to_square):
+                    count += 1
+
+        if checkers:
+            # Only the single checker can be captured by pieces other than
+            # the king.
+            if BB_SQUARES[msb(checkers)] != checkers:
+                return count
+            them &= checkers
+
+        # Piece captures.
+        pieces = our_pieces & ~self.pawns
+        if king is not None:
+            pieces &= ~BB_SQUARES[king]
+        for from_square in scan_reversed(pieces):
+            targets = self.attacks_mask(from_square) & them
+            if king is not None and blockers & BB_SQUARES[from_square]:
+                targets &= ray(king, from_square)
+            count += popcount(targets)
+
+        # Pawn captures.
+        for from_square in scan_reversed(our_pieces & self.pawns):
+            targets = BB_PAWN_ATTACKS[self.turn][from_square] & them
+            if king is not None and blockers & BB_SQUARES[from_square]:
+                targets &= ray(king, from_square)
+            count += popcount(targets & ~BB_BACKRANKS) + 4 * popcount(targets & BB_BACKRANKS)
+
+        # En passant.
+        if self.ep_square:
+            count += sum(1 for _ in self.generate_legal_ep(from_mask, to_mask))
+
+        return count
+
     def _attacked_for_king(self, path: Bitboard, occupied: Bitboard) -> bool:
         return any(self.attackers_mask(not self.turn, sq, occupied) for sq in scan_reversed(path))
 
@@ -3872,11 +4447,24 @@ class Board(BaseBoard):
         board.fullmove_number = self.fullmove_number
         board.halfmove_clock = self.halfmove_clock
 
+        board._zobrist_hasher = self._zobrist_hasher
+        board._zobrist_board = self._zobrist_board
+
         if stack:
             stack = len(self.move_stack) if stack is True else stack
-            board.move_stack = [copy.copy(move) for move in self.move_stack[-stack:]]
+            board.move_stack = [Move(move.from_square, move.to_square, move.promotion, move.drop) for move in self.move_stack[-stack:]]
             board._stack = self._stack[-stack:]
 
+        if self._repetitions is not None:
+            board._repetitions = [collections.Counter()]
+            for state in board._stack:
+                assert state.repetition is not None
+                key, irreversible = state.repetition
+                if irreversible:
+                    board._repetitions.append(collections.Counter())
+                else:
+                    board._repetitions[-1][key] += 1
+
         return board
 
     @classmethod
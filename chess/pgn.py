@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import abc
+import collections
 import dataclasses
 import enum
+import io
 import itertools
 import logging
+import os
 import re
 import typing
 
@@ -14,8 +17,11 @@ import chess.svg
 
 from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Literal, Mapping, MutableMapping, Set, TextIO, Tuple, Type, TypeVar, Optional, Union
 from chess import Color, Square
+from types import TracebackType
 
 if typing.TYPE_CHECKING:
+    import concurrent.futures
+    import mmap
     from typing_extensions import Self
 
 
@@ -100,6 +106,12 @@ MOVETEXT_REGEX = re.compile(r"""
 
 SKIP_MOVETEXT_REGEX = re.compile(r""";|\{|\}""")
 
+# Tokens that matter for finding the end of the movetext in raw bytes: brace
+# comments, rest-of-line comments, escaped lines and empty lines.
+SCAN_TAGS_REGEX = re.compile(rb"""(?:\[[^\n]*\n)*""")
+SCAN_MOVETEXT_REGEX = re.compile(rb"""\{|;|\n%|\n(?=[ \t\r\f\v]*(?:\n|\Z))""")
+SCAN_TAG_REGEX = re.compile(rb"""^\[([A-Za-z0-9][A-Za-z0-9_+#=:-]*)[^\S\n]+"([^\r\n]*)"\][^\S\n]*$""", re.MULTILINE)
+
 
 CLOCK_REGEX = re.compile(r"""(?P<prefix>\s?)\[%clk\s(?P<hours>\d+):(?P<minutes>\d+):(?P<seconds>\d+(?:\.\d*)?)\](?P<suffix>\s?)""")
 EMT_REGEX = re.compile(r"""(?P<prefix>\s?)\[%emt\s(?P<hours>\d+):(?P<minutes>\d+):(?P<seconds>\d+(?:\.\d*)?)\](?P<suffix>\s?)""")
@@ -178,6 +190,88 @@ class TimeControl:
     type: TimeControlType = TimeControlType.UNKNOWN
 
 
+class BoardCache:
+    """
+    A least recently used cache of game node boards, to make
+    :func:`GameNode.board() <chess.pgn.GameNode.board()>` cheap when it is
+    called for many nodes of a game. Enable it by setting
+    :data:`Game.board_cache <chess.pgn.Game.board_cache>`:
+
+    >>> import chess.pgn
+    >>>
+    >>> game = chess.pgn.read_game(io.StringIO("1. e4 e5 2. Nf3 Nc6 3. Bb5 *"))
+    >>> game.board_cache = chess.pgn.BoardCache()
+    >>> [node.board().fen() for node in game.mainline()][-1]
+    'r1bqkbnr/pppp1ppp/2n5/1B2p3/4P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3'
+
+    Each call caches the board of the node it was called for, and the
+    boards every *interval* plies along the way from the closest cached
+    ancestor, evicting the least recently used boards beyond *maxsize*.
+    So walking a line costs one push per node, and other nodes are at
+    most *interval* pushes away from a cached board once their line has
+    been visited.
+
+    The cache assumes the moves and starting position of the game do not
+    change. Call :func:`~chess.pgn.BoardCache.clear()` after editing them
+    (:func:`Game.setup() <chess.pgn.Game.setup()>` does so itself).
+    Adding or reordering variations is fine.
+    """
+
+    def __init__(self, maxsize: int = 256, *, interval: int = 16) -> None:
+        self.maxsize = maxsize
+        self.interval = interval
+        self._boards: typing.OrderedDict[GameNode, Tuple[chess.Board, int]] = collections.OrderedDict()
+
+    def board(self, node: GameNode) -> chess.Board:
+        """Gets a copy of the board at *node*, using and filling the cache."""
+        path: List[GameNode] = []
+        while node.parent is not None:
+            entry = self._boards.get(node)
+            if entry is not None:
+                board, ply = entry
+                if path and ply % self.interval:
+                    # Not a checkpoint: Take over the board rather than
+                    # copying it, so that walking a line copies once per node.
+                    del self._boards[node]
+                else:
+                    self._boards.move_to_end(node)
+                    board = board.copy()
+                break
+            path.append(node)
+            node = node.parent
+        else:
+            board, ply = node.board(), 0
+
+        while path:
+            node = path.pop()
+            assert node.move is not None
+            board.push(node.move)
+            ply += 1
+            if path and ply % self.interval == 0:
+                self._put(node, board.copy(), ply)
+
+        if node.parent is not None and node not in self._boards:
+            self._put(node, board, ply)
+            board = board.copy()
+
+        return board
+
+    def _put(self, node: GameNode, board: chess.Board, ply: int) -> None:
+        self._boards[node] = (board, ply)
+        if len(self._boards) > self.maxsize:
+            self._boards.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached boards."""
+        self._boards.clear()
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} at {id(self):#x} ({len(self)}/{self.maxsize} boards)>"
+
+
 class _AcceptFrame:
     def __init__(self, node: ChildNode, *, is_variation: bool = False, sidelines: bool = True):
         self.state = "pre"
@@ -230,7 +324,8 @@ class GameNode(abc.ABC):
 
         It's a copy, so modifying the board will not alter the game.
 
-        Complexity is `O(n)`.
+        Complexity is `O(n)`, or a few moves with a
+        :data:`~chess.pgn.Game.board_cache`.
         """
 
     @abc.abstractmethod
@@ -688,6 +783,10 @@ class ChildNode(GameNode):
         self.starting_comment = starting_comment
 
     def board(self) -> chess.Board:
+        cache = self.game().board_cache
+        if cache is not None:
+            return cache.board(self)
+
         stack: List[chess.Move] = []
         node: GameNode = self
 
@@ -833,10 +932,18 @@ class Game(GameNode):
     parsing the game.
     """
 
+    board_cache: Optional[BoardCache]
+    """
+    An optional :class:`~chess.pgn.BoardCache` used by
+    :func:`~chess.pgn.GameNode.board()` of the nodes of this game.
+    Defaults to ``None``.
+    """
+
     def __init__(self, headers: Optional[Union[Mapping[str, str], Iterable[Tuple[str, str]]]] = None) -> None:
         super().__init__()
         self.headers = Headers(headers)
         self.errors = []
+        self.board_cache = None
 
     def board(self) -> chess.Board:
         return self.headers.board()
@@ -858,6 +965,9 @@ class Game(GameNode):
             setup.chess960 = setup.has_chess960_castling_rights()
             fen = setup.fen()
 
+        if self.board_cache is not None:
+            self.board_cache.clear()
+
         if fen == type(setup).starting_fen:
             self.headers.pop("FEN", None)
             self.headers.pop("SetUp", None)
@@ -1810,6 +1920,470 @@ def skip_game(handle: TextIO) -> bool:
     return bool(read_game(handle, Visitor=SkipVisitor))
 
 
+def _skip_line(data: Union[bytes, mmap.mmap], pos: int) -> int:
+    eol = data.find(b"\n", pos)
+    return len(data) if eol == -1 else eol + 1
+
+def _skip_headers(data: Union[bytes, mmap.mmap], pos: int, end: int) -> int:
+    # Skips the headers of a game, with comments and at most one consecutive
+    # empty line between them, like read_game(). Returns the offset of the
+    # first line after them.
+    consecutive_empty_lines = 0
+    while pos < end:
+        match = SCAN_TAGS_REGEX.match(data, pos)
+        assert match, "tag run pattern matches the empty string"
+        if match.end() > pos:
+            consecutive_empty_lines = 0
+            pos = match.end()
+            continue
+
+        line_end = _skip_line(data, pos)
+        line = data[pos:line_end]
+        if line.startswith(b"%") or line.startswith(b";"):
+            pos = line_end
+        elif line.isspace() and consecutive_empty_lines < 1:
+            consecutive_empty_lines += 1
+            pos = line_end
+        elif line.startswith(b"["):
+            consecutive_empty_lines = 0
+            pos = line_end
+        else:
+            break
+    return pos
+
+def scan_game_offsets(data: Union[bytes, mmap.mmap], start: int = 0) -> Iterator[int]:
+    """
+    Scans raw PGN bytes, for example a :class:`mmap.mmap`, and yields the
+    byte offset where each game starts, without parsing the games.
+
+    Games are delimited the same way :func:`~chess.pgn.read_game()` does
+    it, so :func:`~chess.pgn.read_game()` on a handle positioned at one of
+    the offsets reads exactly that game. Brace comments are skipped, so
+    empty lines inside them do not end a game.
+
+    *start* must be the start of a line that is not inside a game.
+    """
+    end = len(data)
+    pos = start
+    if data[pos:pos + 3] == b"\xef\xbb\xbf":
+        pos += 3
+
+    while pos < end:
+        # Skip empty lines and comments before the game.
+        line_end = _skip_line(data, pos)
+        line = data[pos:line_end]
+        if line.isspace() or line.startswith(b"%") or line.startswith(b";"):
+            pos = line_end
+            continue
+
+        yield pos
+
+        pos = _skip_headers(data, pos, end)
+
+        # Movetext, up to the next empty line outside of comments.
+        if pos < end and data[pos:_skip_line(data, pos)].isspace():
+            continue
+        while pos < end:
+            match = SCAN_MOVETEXT_REGEX.search(data, pos)
+            if match is None:
+                pos = end
+            elif match.group(0) == b"{":
+                close_index = data.find(b"}", match.end())
+                pos = end if close_index == -1 else close_index + 1
+            elif match.group(0) == b"\n":
+                pos = match.end()
+                break
+            else:
+                # Rest of line comment or escaped line. Stop at the newline,
+                # so that an empty line after it is still found.
+                eol = data.find(b"\n", match.end())
+                pos = end if eol == -1 else eol
+
+
+def scan_headers(path: str, *, encoding: str = "utf-8") -> Iterator[Headers]:
+    """
+    Scans a PGN file for game headers only, much faster than
+    :func:`~chess.pgn.read_headers()`.
+
+    The file is memory mapped and the scanner jumps from one line starting
+    with an ``[Event "`` tag to the next, without looking at the movetext
+    in between. Comments and single empty lines between the tags are
+    skipped, as :func:`~chess.pgn.read_game()` does.
+
+    This relies on every game starting with an *Event* tag, as
+    it does in files exported by :class:`~chess.pgn.StringExporter` and
+    most other software. Games without one are not seen, and a comment line
+    starting with ``[Event "`` would be taken for the start of a game. Use
+    :func:`~chess.pgn.read_headers()` where that matters.
+
+    >>> import chess.pgn
+    >>>
+    >>> for headers in chess.pgn.scan_headers("data/pgn/kasparov-deep-blue-1997.pgn"):  # doctest: +SKIP
+    ...     print(headers["Result"])
+    """
+    import mmap
+
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Empty file
+
+    with data:
+        end = len(data)
+        pos = 3 if data[:3] == b"\xef\xbb\xbf" else 0
+        while pos < end:
+            if data[pos:pos + 7] != b"[Event ":
+                pos = data.find(b"\n[Event ", pos)
+                if pos == -1:
+                    break
+                pos += 1
+
+            # Tag pairs up to the movetext or, for a game without movetext,
+            # up to the Event tag of the next game.
+            tags_end = _skip_headers(data, pos, end)
+            next_event = data.find(b"\n[Event ", pos, tags_end)
+            if next_event != -1:
+                tags_end = next_event + 1
+
+            # The tag names and values are already validated by the regex.
+            headers = Headers({})
+            for name, value in SCAN_TAG_REGEX.findall(data, pos, tags_end):
+                tagname = name.decode("ascii")
+                if tagname in TAG_ROSTER:
+                    headers._tag_roster[tagname] = value.decode(encoding, "replace")
+                else:
+                    headers._others[tagname] = value.decode(encoding, "replace")
+
+            yield headers
+            pos = tags_end
+
+
+def _read_games_at(path: str, offsets: List[int], end: int, Visitor: Any, encoding: str) -> List[Any]:
+    with open(path, "rb") as f:
+        f.seek(offsets[0])
+        data = f.read(end - offsets[0])
+
+    results = []
+    for start, stop in zip(offsets, offsets[1:] + [end]):
+        chunk = data[start - offsets[0]:stop - offsets[0]]
+        results.append(read_game(io.TextIOWrapper(io.BytesIO(chunk), encoding=encoding), Visitor=Visitor))
+    return results
+
+@typing.overload
+def read_games_parallel(path: str, *, processes: Optional[int] = None, ordered: bool = True, chunk_size: int = 4 * 1024 * 1024, encoding: str = "utf-8") -> Iterator[Game]: ...
+@typing.overload
+def read_games_parallel(path: str, *, Visitor: Callable[[], BaseVisitor[ResultT]], processes: Optional[int] = None, ordered: bool = True, chunk_size: int = 4 * 1024 * 1024, encoding: str = "utf-8") -> Iterator[ResultT]: ...
+def read_games_parallel(path: str, *, Visitor: Any = GameBuilder, processes: Optional[int] = None, ordered: bool = True, chunk_size: int = 4 * 1024 * 1024, encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Reads all games of a PGN file with a pool of worker processes.
+
+    The file is scanned for game boundaries with
+    :func:`~chess.pgn.scan_game_offsets()` and split into chunks of about
+    *chunk_size* bytes, which are parsed with
+    :func:`~chess.pgn.read_game()` and the given *Visitor* in up to
+    *processes* worker processes (defaults to the number of CPUs).
+
+    Yields the results in file order, or in the order they become available
+    if *ordered* is ``False``. Only a few chunks per process are in flight
+    at any time, so memory use does not grow with the file size.
+
+    *Visitor* and its results are sent between processes, so they must be
+    picklable. Module level classes are. Where worker processes are spawned
+    rather than forked, the calling script needs an
+    ``if __name__ == "__main__":`` guard.
+
+    >>> import chess.pgn
+    >>>
+    >>> for headers in chess.pgn.read_games_parallel("data/pgn/kasparov-deep-blue-1997.pgn", Visitor=chess.pgn.HeadersBuilder):  # doctest: +SKIP
+    ...     print(headers["Result"])
+    """
+    import concurrent.futures
+    import mmap
+
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Empty file
+
+    processes = processes or os.cpu_count() or 1
+    max_pending = 2 * processes
+
+    with data, concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        pending: typing.Deque[concurrent.futures.Future[List[Any]]] = collections.deque()
+
+        def submit_chunks() -> Iterator[concurrent.futures.Future[List[Any]]]:
+            offsets: List[int] = []
+            for offset in scan_game_offsets(data):
+                if offsets and offset - offsets[0] >= chunk_size:
+                    yield executor.submit(_read_games_at, path, offsets, offset, Visitor, encoding)
+                    offsets = []
+                offsets.append(offset)
+            if offsets:
+                yield executor.submit(_read_games_at, path, offsets, len(data), Visitor, encoding)
+
+        for future in submit_chunks():
+            pending.append(future)
+            while len(pending) >= max_pending:
+                if ordered:
+                    yield from pending.popleft().result()
+                else:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield from future.result()
+
+        if ordered:
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            for future in concurrent.futures.as_completed(pending):
+                yield from future.result()
+
+
+INDEX_HEADERS = ["Event", "Date", "White", "Black", "Result", "Termination"]
+"""Headers stored in a PGN index by default."""
+
+INDEX_VERSION = 1
+
+COMMENTS_REGEX = re.compile(r"\{[^}]*\}?|;[^\n]*|^%[^\n]*", re.MULTILINE)
+
+
+def _scan_tags(data: Union[bytes, mmap.mmap], pos: int, end: int, encoding: str = "utf-8") -> Tuple[List[Tuple[str, str]], int]:
+    # Reads the tag pairs at the start of a game. Returns them with the
+    # offset of the first line after them.
+    tags = []
+    while pos < end:
+        line_end = min(_skip_line(data, pos), end)
+        line = data[pos:line_end]
+        if line.startswith(b"["):
+            tag_match = TAG_REGEX.match(line.decode(encoding, "replace"))
+            if tag_match:
+                tags.append((tag_match.group(1), tag_match.group(2)))
+        elif not (line.isspace() or line.startswith(b"%") or line.startswith(b";")):
+            break
+        pos = line_end
+    return tags, pos
+
+def _count_mainline_plies(movetext: str) -> int:
+    plies = 0
+    depth = 0
+    for match in MOVETEXT_REGEX.finditer(COMMENTS_REGEX.sub(" ", movetext)):
+        token = match.group(0)
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth = max(depth - 1, 0)
+        elif match.group(1) and not depth:
+            plies += 1
+    return plies
+
+
+@dataclasses.dataclass
+class IndexEntry:
+    """A game in a :class:`~chess.pgn.PgnIndex`."""
+
+    number: int
+    """The number of the game in the file, starting at 0."""
+
+    offset: int
+    """The byte offset of the game in the file."""
+
+    length: int
+    """The length of the game in bytes."""
+
+    plies: int
+    """The number of half-moves of the mainline."""
+
+    headers: Dict[str, str]
+    """The indexed headers of the game."""
+
+
+class PgnIndex:
+    """
+    Random access to the games of a PGN file, by number or by headers,
+    through a sidecar index. Use :func:`chess.pgn.open_index()` to open
+    or build one.
+
+    The index is an SQLite database with the byte offset and length, the
+    mainline ply count and the chosen headers of every game, so looking up a
+    game does not depend on the size of the file.
+    """
+
+    def __init__(self, path: str, index_path: str, headers: Iterable[str], *, encoding: str = "utf-8") -> None:
+        self.path = path
+        self.index_path = index_path
+        self.headers = list(headers)
+        self.encoding = encoding
+        import sqlite3
+
+        self._handle = open(path, "rb")
+        self._db = sqlite3.connect(index_path)
+
+        meta = self._meta()
+        if meta.get("version") != str(INDEX_VERSION) or meta.get("headers") != "\n".join(self.headers) or meta.get("encoding") != self.encoding:
+            self._create()
+
+    def _meta(self) -> Dict[str, str]:
+        import sqlite3
+
+        try:
+            return dict(self._db.execute("SELECT key, value FROM meta"))
+        except sqlite3.OperationalError:
+            return {}
+
+    def _create(self) -> None:
+        with self._db:
+            self._db.executescript("""
+                DROP TABLE IF EXISTS meta;
+                DROP TABLE IF EXISTS games;
+                DROP TABLE IF EXISTS headers;
+                CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE games (number INTEGER PRIMARY KEY, offset INTEGER, length INTEGER, plies INTEGER);
+                CREATE TABLE headers (number INTEGER, name TEXT, value TEXT, PRIMARY KEY (number, name)) WITHOUT ROWID;
+                CREATE INDEX headers_by_value ON headers (name, value);
+            """)
+            self._db.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ("version", str(INDEX_VERSION)),
+                ("headers", "\n".join(self.headers)),
+                ("encoding", self.encoding),
+                ("size", "0"),
+            ])
+
+    def update(self) -> int:
+        """
+        Indexes the games that were added to the file since the index was
+        built or last updated, and rebuilds it if the file shrank. Returns
+        the number of newly indexed games.
+        """
+        size = os.fstat(self._handle.fileno()).st_size
+        indexed_size = int(self._meta().get("size", 0))
+        if size == indexed_size:
+            return 0
+        elif size < indexed_size:
+            self._create()
+            if not size:
+                return 0
+
+        # The last game may have been incomplete, so index it again.
+        last = self._db.execute("SELECT number, offset FROM games ORDER BY number DESC LIMIT 1").fetchone()
+        number, start = last if last else (0, 0)
+
+        import mmap
+
+        wanted = set(self.headers)
+        count = 0
+        with self._db, mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            self._db.execute("DELETE FROM games WHERE number >= ?", (number, ))
+            self._db.execute("DELETE FROM headers WHERE number >= ?", (number, ))
+
+            offsets = scan_game_offsets(data, start)
+            offset = next(offsets, None)
+            while offset is not None:
+                next_offset = next(offsets, None)
+                end = len(data) if next_offset is None else next_offset
+
+                tags, movetext = _scan_tags(data, offset, end, self.encoding)
+                plies = _count_mainline_plies(data[movetext:end].decode(self.encoding, "replace"))
+                self._db.execute("INSERT INTO games VALUES (?, ?, ?, ?)", (number, offset, end - offset, plies))
+                self._db.executemany("INSERT OR REPLACE INTO headers VALUES (?, ?, ?)", [(number, name, value) for name, value in tags if name in wanted])
+
+                number += 1
+                count += 1
+                offset = next_offset
+
+            self._db.execute("UPDATE meta SET value = ? WHERE key = 'size'", (str(size), ))
+
+        return max(count - 1, 0) if last else count
+
+    def __len__(self) -> int:
+        count: int = self._db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+        return count
+
+    def _entry(self, row: Tuple[int, int, int, int]) -> IndexEntry:
+        number, offset, length, plies = row
+        headers = dict(self._db.execute("SELECT name, value FROM headers WHERE number = ?", (number, )))
+        return IndexEntry(number, offset, length, plies, headers)
+
+    def __getitem__(self, number: int) -> IndexEntry:
+        """Gets the index entry of a game by number."""
+        row = self._db.execute("SELECT number, offset, length, plies FROM games WHERE number = ?", (number, )).fetchone()
+        if row is None:
+            raise IndexError(f"no game {number} in {self.path!r}")
+        return self._entry(row)
+
+    def find(self, **headers: str) -> Iterator[IndexEntry]:
+        """
+        Finds the games with all of the given header values, in file order.
+        Only indexed headers can be used.
+
+        >>> import chess.pgn
+        >>>
+        >>> with chess.pgn.open_index("data/pgn/kasparov-deep-blue-1997.pgn") as index:  # doctest: +SKIP
+        ...     for entry in index.find(White="Garry Kasparov", Result="1-0"):
+        ...         game = index.read_game(entry.number)
+        """
+        for name in headers:
+            if name not in self.headers:
+                raise ValueError(f"header {name!r} is not indexed (indexed: {', '.join(self.headers)})")
+
+        if headers:
+            query = " INTERSECT ".join(["SELECT number FROM headers WHERE name = ? AND value = ?"] * len(headers))
+            params = [param for item in headers.items() for param in item]
+            sql = f"SELECT number, offset, length, plies FROM games WHERE number IN ({query}) ORDER BY number"
+        else:
+            params = []
+            sql = "SELECT number, offset, length, plies FROM games ORDER BY number"
+
+        for row in self._db.execute(sql, params).fetchall():
+            yield self._entry(row)
+
+    @typing.overload
+    def read_game(self, number: int) -> Optional[Game]: ...
+    @typing.overload
+    def read_game(self, number: int, *, Visitor: Callable[[], BaseVisitor[ResultT]]) -> Optional[ResultT]: ...
+    def read_game(self, number: int, *, Visitor: Any = GameBuilder) -> Any:
+        """Reads a game by number with :func:`~chess.pgn.read_game()`."""
+        entry = self[number]
+        self._handle.seek(entry.offset)
+        data = self._handle.read(entry.length)
+        return read_game(io.TextIOWrapper(io.BytesIO(data), encoding=self.encoding), Visitor=Visitor)
+
+    def close(self) -> None:
+        """Closes the PGN file and the index."""
+        self._handle.close()
+        self._db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException], traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} at {id(self):#x} ({self.path!r}, {len(self)} games)>"
+
+
+def open_index(path: str, index_path: Optional[str] = None, *, headers: Iterable[str] = INDEX_HEADERS, encoding: str = "utf-8") -> PgnIndex:
+    """
+    Opens the sidecar index of a PGN file for random access to its games,
+    see :class:`~chess.pgn.PgnIndex`. The index is stored at *index_path*,
+    by default the path of the PGN file with ``.idx`` appended.
+
+    The index is built on first use and brought up to date with games
+    appended to the file since. It is rebuilt if the file shrank or
+    different *headers* or a different *encoding* are requested.
+    """
+    index = PgnIndex(path, path + ".idx" if index_path is None else index_path, headers, encoding=encoding)
+    try:
+        index.update()
+    except:
+        index.close()
+        raise
+    return index
+
+
 def parse_time_control(time_control: str) -> TimeControl:
     tc = TimeControl()
 
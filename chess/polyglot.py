@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import chess
+import collections
 import struct
 import os
 import mmap
 import random
+import threading
 import typing
 
 from types import TracebackType
-from typing import Callable, Container, Iterator, List, NamedTuple, Optional, Type, Union
+from typing import Callable, Container, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+if typing.TYPE_CHECKING:
+    import chess.pgn
+    import numpy
 
 
 StrOrBytesPath = Union[str, bytes, "os.PathLike[str]", "os.PathLike[bytes]"]
@@ -16,6 +22,9 @@ StrOrBytesPath = Union[str, bytes, "os.PathLike[str]", "os.PathLike[bytes]"]
 
 ENTRY_STRUCT = struct.Struct(">QHHI")
 
+ENTRY_DTYPE = [("key", ">u8"), ("raw_move", ">u2"), ("weight", ">u2"), ("learn", ">u4")]
+"""The layout of :data:`~chess.polyglot.ENTRY_STRUCT` as a NumPy dtype."""
+
 
 POLYGLOT_RANDOM_ARRAY = [
     0x9D39247E33776D41, 0x2AF7398005AAA5C7, 0x44DB015024623547, 0x9C15F73E62A76AE2,
@@ -267,11 +276,19 @@ class ZobristHasher:
         return self.array[780] if board.turn == chess.WHITE else 0
 
     def __call__(self, board: chess.Board) -> int:
-        return (self.hash_board(board) ^ self.hash_castling(board) ^
+        if board._zobrist_hasher is self:
+            board_hash = board._zobrist_board_hash()
+        else:
+            board_hash = self.hash_board(board)
+
+        return (board_hash ^ self.hash_castling(board) ^
                 self.hash_ep_square(board) ^ self.hash_turn(board))
 
 
-def zobrist_hash(board: chess.Board, *, _hasher: Callable[[chess.Board], int] = ZobristHasher(POLYGLOT_RANDOM_ARRAY)) -> int:
+POLYGLOT_HASHER = ZobristHasher(POLYGLOT_RANDOM_ARRAY)
+
+
+def zobrist_hash(board: chess.Board, *, _hasher: Callable[[chess.Board], int] = POLYGLOT_HASHER) -> int:
     """
     Calculates the Polyglot Zobrist hash of the position.
 
@@ -279,6 +296,10 @@ def zobrist_hash(board: chess.Board, *, _hasher: Callable[[chess.Board], int] =
     an array. Which values are picked is decided by features of the
     position, such as piece positions, castling rights and en passant
     squares.
+
+    Boards with :func:`~chess.Board.track_zobrist_hash()` enabled keep the
+    piece part of the hash up to date incrementally, so only castling
+    rights, en passant square and turn are hashed on demand.
     """
     return _hasher(board)
 
@@ -305,9 +326,11 @@ class Entry(NamedTuple):
     """The :class:`~chess.Move`."""
 
 
-class _EmptyMmap(bytearray):
+class _MemoryMap(bytearray):
+    # Stands in for the mmap of empty and merged books.
+
     def size(self) -> int:
-        return 0
+        return len(self)
 
     def close(self) -> None:
         pass
@@ -326,21 +349,30 @@ class MemoryMappedReader:
     def __init__(self, filename: StrOrBytesPath) -> None:
         fd = os.open(filename, os.O_RDONLY | os.O_BINARY if hasattr(os, "O_BINARY") else os.O_RDONLY)
         try:
-            self.mmap: Union[mmap.mmap, _EmptyMmap] = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            data: Union[mmap.mmap, _MemoryMap] = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
         except (ValueError, OSError):
-            self.mmap = _EmptyMmap()  # Workaround for empty opening books.
+            data = _MemoryMap()  # Workaround for empty opening books.
         finally:
             os.close(fd)
 
-        if self.mmap.size() % ENTRY_STRUCT.size != 0:
+        if data.size() % ENTRY_STRUCT.size != 0:
             raise IOError(f"invalid file size: ensure {filename!r} is a valid polyglot opening book")
 
+        self._init_map(data)
+
+    def _init_map(self, data: Union[mmap.mmap, _MemoryMap]) -> None:
+        # Sets up the state shared by all readers of a book in memory.
+        self.mmap = data
+
         try:
             # Unix
             self.mmap.madvise(mmap.MADV_RANDOM)
         except AttributeError:
             pass
 
+        self._batch_columns: Optional[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]] = None
+        self._batch_main: Dict[int, numpy.ndarray] = {}
+
     def __enter__(self) -> MemoryMappedReader:
         return self
 
@@ -395,6 +427,17 @@ class MemoryMappedReader:
 
         return lo
 
+    def _entries(self, key: int) -> Iterable[Entry]:
+        i = self.bisect_key_left(key)
+        size = len(self)
+
+        while i < size:
+            entry = self[i]
+            if entry.key != key:
+                break
+            yield entry
+            i += 1
+
     def __contains__(self, entry: Entry) -> bool:
         return any(current == entry for current in self.find_all(entry.key, minimum_weight=entry.weight))
 
@@ -407,16 +450,7 @@ class MemoryMappedReader:
             context = typing.cast(chess.Board, board)
             key = zobrist_hash(context)
 
-        i = self.bisect_key_left(key)
-        size = len(self)
-
-        while i < size:
-            entry = self[i]
-            i += 1
-
-            if entry.key != key:
-                break
-
+        for entry in self._entries(key):
             if entry.weight < minimum_weight:
                 continue
 
@@ -495,8 +529,85 @@ class MemoryMappedReader:
 
         assert False
 
+    def as_array(self) -> numpy.ndarray:
+        """
+        Gets all entries as a structured NumPy array with the fields of
+        :data:`~chess.polyglot.ENTRY_DTYPE`, without copying. Requires NumPy.
+
+        The array is a view of the mapped file, so it must be deleted before
+        the reader is closed.
+        """
+        import numpy as np
+        return np.frombuffer(self.mmap, dtype=np.dtype(ENTRY_DTYPE))
+
+    def find_batch(self, keys: Union[Sequence[int], numpy.ndarray], *, minimum_weight: int = 1) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Finds the main entry for many Zobrist hashes at once, like
+        :func:`~chess.polyglot.MemoryMappedReader.find()` does for one.
+        Requires NumPy.
+
+        Returns three arrays with an element for each key: the index of the
+        main entry in the book (or ``-1`` if there is none), its raw move and
+        its weight (both ``0`` if there is none). Decode moves by indexing
+        the reader. Unlike lookups by board, this does not check that the
+        moves are legal.
+
+        >>> import chess.polyglot
+        >>>
+        >>> with chess.polyglot.open_reader("data/polyglot/performance.bin") as reader:  # doctest: +SKIP
+        ...     index, raw_move, weight = reader.find_batch(keys)
+        ...     coverage = (index >= 0).mean()
+        """
+        import numpy as np
+
+        book_keys, raw_moves, weights, main = self._batch_index(minimum_weight)
+        keys = np.asarray(keys, dtype=np.uint64)
+        start = np.searchsorted(book_keys[:-1], keys)
+        index = np.where(book_keys[start] == keys, main[start], -1)
+        return index, raw_moves[index], weights[index]
+
+    def _batch_index(self, minimum_weight: int) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        # Built on first use and kept until the reader is closed, so that a
+        # batch lookup costs a binary search per key, not a pass over the book.
+        import numpy as np
+
+        if self._batch_columns is None:
+            entries = self.as_array()
+            try:
+                # Columns with a trailing sentinel, so that a key beyond the
+                # end of the book and index -1 select no move and weight 0.
+                size = len(entries)
+                book_keys = np.zeros(size + 1, dtype=np.uint64)
+                book_keys[:size] = entries["key"]
+                raw_moves = np.zeros(size + 1, dtype=np.uint16)
+                raw_moves[:size] = entries["raw_move"]
+                weights = np.zeros(size + 1, dtype=np.uint16)
+                weights[:size] = entries["weight"]
+                self._batch_columns = (book_keys, raw_moves, weights)
+            finally:
+                del entries
+
+        book_keys, raw_moves, weights = self._batch_columns
+
+        main = self._batch_main.get(minimum_weight)
+        if main is None:
+            # The main entry of each run of equal keys, stored at the start
+            # of the run: the maximum of weight << 32 | ~index is the first
+            # entry with the highest weight.
+            size = len(book_keys) - 1
+            rank = np.where(weights[:size] >= minimum_weight, (weights[:size].astype(np.int64) << 32) | (0xffffffff - np.arange(size)), -1)
+            run_starts = np.flatnonzero(np.diff(book_keys[:size], prepend=book_keys[:1] + 1))
+            best = np.maximum.reduceat(rank, run_starts) if size else rank
+            main = np.full(size + 1, -1, dtype=np.int64)
+            main[run_starts] = np.where(best >= 0, 0xffffffff - (best & 0xffffffff), -1)
+            self._batch_main[minimum_weight] = main
+
+        return book_keys, raw_moves, weights, main
+
     def close(self) -> None:
         """Closes the reader."""
+        self._batch_columns = None
+        self._batch_main.clear()
         self.mmap.close()
 
 
@@ -520,3 +631,231 @@ def open_reader(path: StrOrBytesPath) -> MemoryMappedReader:
     c2c4 1 0
     """
     return MemoryMappedReader(path)
+
+
+def _encode_move(board: chess.Board, move: chess.Move) -> int:
+    # Polyglot encodes castling as the king capturing its rook.
+    if not board.chess960:
+        move = board._to_chess960(move)
+
+    if move.drop:
+        return move.to_square | move.to_square << 6 | (move.drop - 1) << 12
+
+    promotion_part = move.promotion - 1 if move.promotion else 0
+    return move.to_square | move.from_square << 6 | promotion_part << 12
+
+
+class BookBuilder:
+    """
+    Collects move statistics and writes them as a Polyglot opening book.
+
+    Every move added counts towards the weight of the entry for that move in
+    the position it was played in, so the book reflects how often (and, with
+    :func:`~chess.polyglot.BookBuilder.add_game()`, how successfully) each
+    move was played.
+
+    >>> import chess
+    >>> import chess.polyglot
+    >>>
+    >>> builder = chess.polyglot.BookBuilder()
+    >>> board = chess.Board()
+    >>> builder.add(board, chess.Move.from_uci("e2e4"), 3)
+    >>> builder.add(board, chess.Move.from_uci("d2d4"))
+    >>> builder.write("book.bin")  # doctest: +SKIP
+    2
+    """
+
+    def __init__(self) -> None:
+        self._weights: Dict[Tuple[int, int], int] = {}
+
+    def add(self, board: chess.Board, move: chess.Move, weight: int = 1) -> None:
+        """Adds *weight* to the entry for *move* in the position on *board*."""
+        if move and weight:
+            key = (zobrist_hash(board), _encode_move(board, move))
+            self._weights[key] = self._weights.get(key, 0) + weight
+
+    def add_game(self, game: chess.pgn.Game, *, max_ply: Optional[int] = None, color: Optional[chess.Color] = None, points: Tuple[int, int, int] = (2, 1, 0)) -> int:
+        """
+        Adds the mainline moves of a game, up to *max_ply* half-moves and
+        optionally only those of one *color*.
+
+        Each move is weighted by the result of the game for the side that
+        played it: *points* are the weights for a win, a draw and a loss.
+        The default favors moves that won. ``(0, 1, 2)`` builds a book of
+        moves that lost.
+
+        Returns the number of moves added. Games without a result are
+        skipped.
+        """
+        result = game.headers.get("Result", "*")
+        if result == "1-0":
+            winner: Optional[chess.Color] = chess.WHITE
+        elif result == "0-1":
+            winner = chess.BLACK
+        elif result == "1/2-1/2":
+            winner = None
+        else:
+            return 0
+
+        count = 0
+        board = game.board()
+        for ply, move in enumerate(game.mainline_moves()):
+            if max_ply is not None and ply >= max_ply:
+                break
+
+            if color is None or board.turn == color:
+                if winner is None:
+                    weight = points[1]
+                else:
+                    weight = points[0] if board.turn == winner else points[2]
+                if weight:
+                    self.add(board, move, weight)
+                    count += 1
+
+            board.push(move)
+
+        return count
+
+    def add_book(self, reader: MemoryMappedReader, scale: float = 1) -> None:
+        """
+        Adds the entries of another book, with their weights multiplied by
+        *scale*. The learn values are not kept.
+        """
+        for key, raw_move, weight, _ in ENTRY_STRUCT.iter_unpack(reader.mmap):
+            weight = round(weight * scale)
+            if weight:
+                self._weights[key, raw_move] = self._weights.get((key, raw_move), 0) + weight
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def write(self, path: StrOrBytesPath) -> int:
+        """
+        Writes the book to the given path, sorted by key and then by
+        descending weight, as :class:`~chess.polyglot.MemoryMappedReader`
+        expects. Where the weights of a position exceed 16 bits, they are
+        scaled down proportionally.
+
+        Returns the number of entries written.
+        """
+        data = self._serialize()
+        with open(path, "wb") as f:
+            f.write(data)
+
+        return len(data) // ENTRY_STRUCT.size
+
+    def _serialize(self) -> bytearray:
+        by_key: Dict[int, List[Tuple[int, int]]] = {}
+        for (key, raw_move), weight in self._weights.items():
+            by_key.setdefault(key, []).append((-weight, raw_move))
+
+        data = bytearray()
+        for key in sorted(by_key):
+            moves = sorted(by_key[key])
+            top = -moves[0][0]
+            for weight, raw_move in moves:
+                weight = -weight
+                if top > 0xffff:
+                    weight = max(1, weight * 0xffff // top)
+                data += ENTRY_STRUCT.pack(key, raw_move, weight, 0)
+
+        return data
+
+
+def _merge_entries(keys: numpy.ndarray, raw_moves: numpy.ndarray, weights: numpy.ndarray) -> bytes:
+    # Like BookBuilder, but on whole columns: adds up the weights of equal
+    # moves, sorts by key and descending weight, and scales down positions
+    # whose weights exceed 16 bits.
+    import numpy as np
+
+    nonzero = weights != 0
+    keys, raw_moves, weights = keys[nonzero], raw_moves[nonzero], weights[nonzero]
+
+    order = np.lexsort((raw_moves, keys))
+    keys, raw_moves, weights = keys[order], raw_moves[order], weights[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = (keys[1:] != keys[:-1]) | (raw_moves[1:] != raw_moves[:-1])
+    starts = np.flatnonzero(first)
+    keys, raw_moves = keys[starts], raw_moves[starts]
+    weights = np.add.reduceat(weights, starts) if len(starts) else weights
+
+    order = np.lexsort((raw_moves, -weights, keys))
+    keys, raw_moves, weights = keys[order], raw_moves[order], weights[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    top = weights[first][np.cumsum(first) - 1]
+    weights = np.where(top > 0xffff, np.maximum(1, weights * 0xffff // np.maximum(top, 1)), weights)
+
+    entries = np.zeros(len(keys), dtype=np.dtype(ENTRY_DTYPE))
+    entries["key"] = keys
+    entries["raw_move"] = raw_moves
+    entries["weight"] = weights
+    return entries.tobytes()
+
+
+class MultiBookReader(MemoryMappedReader):
+    """
+    Merges several Polyglot opening books into one book in memory, so that
+    lookups probe a single table instead of every book.
+
+    *books* are paths, or a mapping of paths to a factor for the weights of
+    the book. Entries for the same move in the same position add up. The
+    merged book can be used like any :class:`~chess.polyglot.MemoryMappedReader`
+    and does not keep the files open. Requires NumPy.
+
+    The entries of the last *cache_size* positions looked up are cached,
+    which helps with repeated calls like those of
+    :func:`~chess.polyglot.MemoryMappedReader.weighted_choice()`.
+
+    >>> import chess
+    >>> import chess.polyglot
+    >>>
+    >>> with chess.polyglot.MultiBookReader({"openings.bin": 1, "blunders.bin": 4}) as reader:  # doctest: +SKIP
+    ...     entry = reader.weighted_choice(chess.Board())
+    """
+
+    def __init__(self, books: Union[Iterable[StrOrBytesPath], Mapping[StrOrBytesPath, float]], *, cache_size: int = 1024) -> None:
+        import numpy as np
+
+        scaled_books = books.items() if isinstance(books, Mapping) else ((path, 1) for path in books)
+
+        keys = [np.zeros(0, dtype=np.uint64)]
+        raw_moves = [np.zeros(0, dtype=np.uint16)]
+        weights = [np.zeros(0, dtype=np.int64)]
+        for path, scale in scaled_books:
+            with open_reader(path) as reader:
+                entries = reader.as_array()
+                try:
+                    keys.append(entries["key"].astype(np.uint64))
+                    raw_moves.append(entries["raw_move"].astype(np.uint16))
+                    weights.append(np.rint(entries["weight"].astype(np.int64) * scale).astype(np.int64))
+                finally:
+                    del entries
+
+        self._init_map(_MemoryMap(_merge_entries(np.concatenate(keys), np.concatenate(raw_moves), np.concatenate(weights))))
+        self.cache_size = cache_size
+        self._cache: typing.OrderedDict[int, Tuple[Entry, ...]] = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _entries(self, key: int) -> Iterable[Entry]:
+        with self._cache_lock:
+            try:
+                entries = self._cache[key]
+            except KeyError:
+                pass
+            else:
+                self._cache.move_to_end(key)
+                return entries
+
+        entries = tuple(super()._entries(key))
+        if self.cache_size:
+            with self._cache_lock:
+                self._cache[key] = entries
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return entries
+
+    def close(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+        super().close()
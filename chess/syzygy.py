@@ -12,7 +12,7 @@ import typing
 import chess
 
 from types import TracebackType
-from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, TypeVar, Union
+from typing import Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Type, TypeVar, Union
 
 if typing.TYPE_CHECKING:
     from typing_extensions import Self
@@ -1172,6 +1172,9 @@ class WdlTable(Table):
         try:
             with self.read_condition:
                 self.read_count += 1
+                ready = self.initialized and self.data is not None
+            if not ready:
+                self.init_table_wdl()
             return self._probe_wdl_table(board)
         finally:
             with self.read_condition:
@@ -1179,8 +1182,6 @@ class WdlTable(Table):
                 self.read_condition.notify()
 
     def _probe_wdl_table(self, board: chess.Board) -> int:
-        self.init_table_wdl()
-
         key = calc_key(board)
 
         if not self.symmetric:
@@ -1343,6 +1344,9 @@ class DtzTable(Table):
         try:
             with self.read_condition:
                 self.read_count += 1
+                ready = self.initialized and self.data is not None
+            if not ready:
+                self.init_table_dtz()
             return self._probe_dtz_table(board, wdl)
         finally:
             with self.read_condition:
@@ -1350,7 +1354,6 @@ class DtzTable(Table):
                 self.read_condition.notify()
 
     def _probe_dtz_table(self, board: chess.Board, wdl: int) -> Tuple[int, int]:
-        self.init_table_dtz()
         assert self.data
 
         key = calc_key(board)
@@ -1461,39 +1464,108 @@ class DtzTable(Table):
         self.tb_size[p_tb_size] = self.calc_factors_pawn(self.files[f].factor, order, order2, self.files[f].norm, f)
 
 
+class CacheInfo(NamedTuple):
+    """Statistics of the probe result cache of a :class:`~chess.syzygy.Tablebase`."""
+
+    hits: int
+    """The number of probes answered from the cache."""
+
+    misses: int
+    """The number of probes that had to look at the tables."""
+
+    maxsize: int
+    """The maximum number of cached results."""
+
+    currsize: int
+    """The number of cached results."""
+
+
 class Tablebase:
     """
     Manages a collection of tablebase files for probing.
+
+    The results of the last *cache_size* calls to
+    :func:`~chess.syzygy.Tablebase.probe_wdl()` and
+    :func:`~chess.syzygy.Tablebase.probe_dtz()` (including those made
+    internally while probing DTZ) are cached by position. Pass ``0`` to
+    disable the cache.
     """
-    def __init__(self, *, max_fds: Optional[int] = 128, VariantBoard: Type[chess.Board] = chess.Board) -> None:
+    def __init__(self, *, max_fds: Optional[int] = 128, VariantBoard: Type[chess.Board] = chess.Board, cache_size: int = 4096) -> None:
         self.variant = VariantBoard
 
         self.max_fds = max_fds
-        self.lru: Deque[Table] = collections.deque()
+        self.lru: typing.OrderedDict[Table, None] = collections.OrderedDict()
         self.lru_lock = threading.Lock()
 
         self.wdl: Dict[str, Table] = {}
         self.dtz: Dict[str, Table] = {}
 
+        self.cache_size = cache_size
+        self._cache: typing.OrderedDict[Tuple[bool, Hashable], int] = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def _probe_cached(self, board: chess.Board, dtz: bool) -> int:
+        if not self.cache_size:
+            return self._probe_dtz(board) if dtz else self._probe_wdl(board)
+
+        key = (dtz, board._transposition_key())
+        with self._cache_lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                self._cache_misses += 1
+            else:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return value
+
+        # Probe without holding the lock. Probing DTZ recurses into this.
+        value = self._probe_dtz(board) if dtz else self._probe_wdl(board)
+
+        with self._cache_lock:
+            self._cache[key] = value
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        """Gets hit and miss counts and the size of the probe result cache."""
+        with self._cache_lock:
+            return CacheInfo(self._cache_hits, self._cache_misses, self.cache_size, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """Clears the probe result cache and its statistics."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+
     def _bump_lru(self, table: Table) -> None:
         if self.max_fds is None:
             return
 
         with self.lru_lock:
             try:
-                self.lru.remove(table)
-                self.lru.appendleft(table)
-            except ValueError:
-                self.lru.appendleft(table)
+                self.lru.move_to_end(table)
+                return
+            except KeyError:
+                self.lru[table] = None
+                if len(self.lru) <= self.max_fds:
+                    return
+                evicted, _ = self.lru.popitem(last=False)
 
-                if len(self.lru) > self.max_fds:
-                    self.lru.pop().close()
+        # Close outside of the lock, because this waits for ongoing probes
+        # of the evicted table.
+        evicted.close()
 
     def _open_table(self, hashtable: Dict[str, Table], Table: Type[Table], path: str) -> int:
         table = Table(path, variant=self.variant)
 
         if table.key in hashtable:
             hashtable[table.key].close()
+            self.cache_clear()
 
         hashtable[table.key] = table
         hashtable[table.mirrored_key] = table
@@ -1686,6 +1758,9 @@ class Tablebase:
 
             Note that probing corrupted table files is undefined behavior.
         """
+        return self._probe_cached(board, False)
+
+    def _probe_wdl(self, board: chess.Board) -> int:
         # Probe.
         v, _ = self.probe_ab(board, -2, 2)
 
@@ -1882,6 +1957,9 @@ class Tablebase:
 
             Note that probing corrupted table files is undefined behavior.
         """
+        return self._probe_cached(board, True)
+
+    def _probe_dtz(self, board: chess.Board) -> int:
         v = self.probe_dtz_no_ep(board)
 
         if not board.ep_square or self.variant.captures_compulsory:
@@ -1940,6 +2018,7 @@ class Tablebase:
             dtz.close()
 
         self.lru.clear()
+        self.cache_clear()
 
     def __enter__(self) -> Tablebase:
         return self
@@ -1948,7 +2027,7 @@ class Tablebase:
         self.close()
 
 
-def open_tablebase(directory: str, *, load_wdl: bool = True, load_dtz: bool = True, max_fds: Optional[int] = 128, VariantBoard: Type[chess.Board] = chess.Board) -> Tablebase:
+def open_tablebase(directory: str, *, load_wdl: bool = True, load_dtz: bool = True, max_fds: Optional[int] = 128, VariantBoard: Type[chess.Board] = chess.Board, cache_size: int = 4096) -> Tablebase:
     """
     Opens a collection of tables for probing. See
     :class:`~chess.syzygy.Tablebase`.
@@ -1966,7 +2045,8 @@ def open_tablebase(directory: str, *, load_wdl: bool = True, load_dtz: bool = Tr
     :param max_fds: If *max_fds* is not ``None``, will at most use *max_fds*
         open file descriptors at any given time. The least recently used tables
         are closed, if necessary.
+    :param cache_size: The number of probe results to cache, or ``0``.
     """
-    tables = Tablebase(max_fds=max_fds, VariantBoard=VariantBoard)
+    tables = Tablebase(max_fds=max_fds, VariantBoard=VariantBoard, cache_size=cache_size)
     tables.add_directory(directory, load_wdl=load_wdl, load_dtz=load_dtz)
     return tables
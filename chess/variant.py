@@ -127,12 +127,21 @@ class SuicideBoard(chess.Board):
         else:
             return not any(self.generate_pseudo_legal_captures())
 
+    def count_legal_captures(self, from_mask: chess.Bitboard = chess.BB_ALL, to_mask: chess.Bitboard = chess.BB_ALL) -> int:
+        return sum(1 for _ in self.generate_legal_captures(from_mask, to_mask))
+
     def _transposition_key(self) -> Hashable:
         if self.has_chess960_castling_rights():
             return (super()._transposition_key(), self.kings & self.promoted)
         else:
             return super()._transposition_key()
 
+    def _repetition_key(self) -> Hashable:
+        if self.has_chess960_castling_rights():
+            return (super()._repetition_key(), self.kings & self.promoted)
+        else:
+            return super()._repetition_key()
+
     def board_fen(self, *, promoted: Optional[bool] = None) -> str:
         if promoted is None:
             promoted = self.has_chess960_castling_rights()
@@ -306,6 +315,9 @@ class AtomicBoard(chess.Board):
             if self.is_legal(move):
                 yield move
 
+    def count_legal_captures(self, from_mask: chess.Bitboard = chess.BB_ALL, to_mask: chess.Bitboard = chess.BB_ALL) -> int:
+        return sum(1 for _ in self.generate_legal_captures(from_mask, to_mask))
+
     def status(self) -> chess.Status:
         status = super().status()
         status &= ~chess.STATUS_OPPOSITE_CHECK
@@ -370,6 +382,9 @@ class RacingKingsBoard(chess.Board):
             if not self.gives_check(move):
                 yield move
 
+    def count_legal_captures(self, from_mask: chess.Bitboard = chess.BB_ALL, to_mask: chess.Bitboard = chess.BB_ALL) -> int:
+        return sum(1 for _ in self.generate_legal_captures(from_mask, to_mask))
+
     def is_variant_end(self) -> bool:
         if not self.kings & chess.BB_RANK_8:
             return False
@@ -678,6 +693,8 @@ class HordeBoard(chess.Board):
 ThreeCheckBoardT = TypeVar("ThreeCheckBoardT", bound="ThreeCheckBoard")
 
 class _ThreeCheckBoardState:
+    __slots__ = ("remaining_checks_w", "remaining_checks_b")
+
     def __init__(self, board: ThreeCheckBoard) -> None:
         self.remaining_checks_w = board.remaining_checks[chess.WHITE]
         self.remaining_checks_b = board.remaining_checks[chess.BLACK]
@@ -799,6 +816,13 @@ class ThreeCheckBoard(chess.Board):
         return (super()._transposition_key(),
                 self.remaining_checks[chess.WHITE], self.remaining_checks[chess.BLACK])
 
+    def _repetition_key(self) -> Hashable:
+        return (super()._repetition_key(),
+                self.remaining_checks[chess.WHITE], self.remaining_checks[chess.BLACK])
+
+    def _variant_state_key(self) -> Hashable:
+        return self.remaining_checks[chess.WHITE], self.remaining_checks[chess.BLACK]
+
     def copy(self, *, stack: Union[bool, int] = True) -> Self:
         board = super().copy(stack=stack)
         board.remaining_checks = self.remaining_checks.copy()
@@ -825,6 +849,8 @@ class ThreeCheckBoard(chess.Board):
 CrazyhouseBoardT = TypeVar("CrazyhouseBoardT", bound="CrazyhouseBoard")
 
 class _CrazyhouseBoardState:
+    __slots__ = ("pockets_w", "pockets_b")
+
     def __init__(self, board: CrazyhouseBoard) -> None:
         self.pockets_w = board.pockets[chess.WHITE].copy()
         self.pockets_b = board.pockets[chess.BLACK].copy()
@@ -935,6 +961,16 @@ class CrazyhouseBoard(chess.Board):
                 self.promoted,
                 str(self.pockets[chess.WHITE]), str(self.pockets[chess.BLACK]))
 
+    def _repetition_key(self) -> Hashable:
+        # Ceding en passant is reversible in crazyhouse.
+        return (super()._repetition_key(),
+                self.promoted,
+                str(self.pockets[chess.WHITE]), str(self.pockets[chess.BLACK]),
+                self.ep_square if self.has_legal_en_passant() else None)
+
+    def _variant_state_key(self) -> Hashable:
+        return str(self.pockets[chess.WHITE]), str(self.pockets[chess.BLACK])
+
     def legal_drop_squares_mask(self) -> chess.Bitboard:
         king = self.king(self.turn)
         if king is None:
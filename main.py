@@ -1,9 +1,14 @@
 import pygame
 import chess
+import chess.polyglot
 import asyncio
+import concurrent.futures
 import os
 import platform
 import json
+import time
+
+from anti_engine import AntiEngine, LoserBoard
 
 # Initialize pygame
 pygame.init()
@@ -20,6 +25,21 @@ SQUARE_SIZE = WIDTH // 8
 PIECE_SIZE = int(SQUARE_SIZE * 0.8)
 PIECE_OFFSET = (SQUARE_SIZE - PIECE_SIZE) // 2
 AI_MOVE_DELAY_MS = 300
+AI_TIME_SLICE_MS = 8     # search time per frame when the AI cannot run in a thread
+
+# AI difficulty: "classic" is the original 1-ply scorer, the others run the
+# anti-engine search with a (max depth, time budget in seconds) limit.
+AI_LEVELS = {
+    'classic': None,
+    'hard':    (2, 0.5),
+    'perfect': (4, 2.0),
+}
+AI_LEVEL = 'classic'
+
+# Opening book of losing moves built by build_book.py. While the game is in
+# the book, the AI plays from it instead of searching.
+BOOK_PATH = 'assets/loser_book.bin'
+BOOK_MAX_PLY = 24
 
 font_large  = pygame.font.SysFont('arial', 64)
 font_medium = pygame.font.SysFont('arial', 48)
@@ -42,7 +62,15 @@ for p in piece_names:
         print(f"Error loading {filename}: {e}")
 
 # Board setup
-board = chess.Board()
+board = LoserBoard()
+board.track_repetitions()   # O(1) threefold checks in check_game_over()
+anti_engine = AntiEngine(*AI_LEVELS[AI_LEVEL]) if AI_LEVELS[AI_LEVEL] else None
+book = None
+if os.path.exists(BOOK_PATH):
+    try:
+        book = chess.polyglot.open_reader(BOOK_PATH)
+    except Exception as e:
+        print(f"Error loading {BOOK_PATH}: {e}")
 clock = pygame.time.Clock()
 selected_square  = None
 dragging_piece   = None   # (x, y, symbol_str)
@@ -50,6 +78,13 @@ game_over        = False
 winner           = ""
 last_move        = None
 animating_piece  = None   # dict with 'from_sq', 'to_sq', 'symbol', 'start_time', 'duration'
+ai_future        = None   # future with the AI reply while it is being searched
+ai_move_due      = 0      # ticks before which the AI reply is not played
+
+# The AI searches in a worker thread on desktop. The browser build has no
+# threads, so there the search runs as an asyncio task in small time slices.
+ai_executor = (None if platform.system() == "Emscripten"
+               else concurrent.futures.ThreadPoolExecutor(max_workers=1))
 
 # Sound setup
 move_sound = None
@@ -76,55 +111,136 @@ except Exception as e:
 # Drawing helpers
 # ---------------------------------------------
 
-def draw_board():
-    """Draw squares, selection highlight, last-move highlight, and legal-move dots/rings."""
+# The board is drawn with dirty rectangles: the squares and labels are
+# rendered once into cached surfaces, and each frame only repaints the squares
+# whose contents changed or that a moving piece covered, then hands just those
+# rects to pygame.display.update().
+background      = None   # plain light/dark squares
+label_layer     = None   # transparent layer with the file/rank labels
+drawn_squares   = {}     # square -> state currently on screen
+drawn_sprites   = []     # rects of the dragged/animated pieces currently on screen
+full_redraw     = True   # repaint every square on the next frame
+overlay_hover   = None   # button hover state the game-over overlay was drawn with (None = not drawn)
+
+
+# Surfaces that never change (translucent fills, rendered text, the dialog
+# card) are built on first use and reused, instead of being allocated every
+# time they are drawn. Callers must not draw on the returned surfaces.
+surface_cache = {}
+
+
+def cached_surface(key, build):
+    """Return the surface cached under *key*, calling *build()* to create it once."""
+    surf = surface_cache.get(key)
+    if surf is None:
+        surf = surface_cache[key] = build()
+    return surf
+
+
+def tint_surface(size, rgba):
+    """A translucent surface of the given size filled with an RGBA color."""
+    def build():
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(rgba)
+        return surf
+    return cached_surface(('tint', size, rgba), build)
+
+
+def text_surface(font, text, color):
+    """Anti-aliased text rendered with the given font and color."""
+    return cached_surface(('text', font, text, color), lambda: font.render(text, True, color))
+
+
+def square_rect(sq):
+    """Screen rect of a square (White at the bottom)."""
+    return pygame.Rect(chess.square_file(sq) * SQUARE_SIZE, (7 - chess.square_rank(sq)) * SQUARE_SIZE,
+                       SQUARE_SIZE, SQUARE_SIZE)
+
+
+def squares_under(rect):
+    """All squares that a screen rect overlaps."""
+    rect = rect.clip(screen.get_rect())
+    if not rect.width or not rect.height:
+        return []
+    cols = range(rect.left // SQUARE_SIZE, (rect.right - 1) // SQUARE_SIZE + 1)
+    rows = range(rect.top // SQUARE_SIZE, (rect.bottom - 1) // SQUARE_SIZE + 1)
+    return [chess.square(col, 7 - row) for row in rows for col in cols]
+
+
+def build_background():
+    """Render the squares and the labels into the cached surfaces."""
+    global background, label_layer
+    background = pygame.Surface((WIDTH, HEIGHT)).convert()
+    for sq in chess.SQUARES:
+        row, col = 7 - chess.square_rank(sq), chess.square_file(sq)
+        color = COLORS['white'] if (row + col) % 2 == 0 else COLORS['black']
+        pygame.draw.rect(background, color, square_rect(sq))
+
+    label_layer = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    draw_labels(label_layer)
+
+
+def square_state(sq, piece_map, hidden, possible_targets):
+    """Everything that decides how a square looks, to detect changes between frames."""
+    piece = piece_map.get(sq)
+    symbol = piece.symbol() if piece and sq not in hidden else None
+    target = None
+    if sq in possible_targets:
+        target = 'ring' if piece else 'dot'
+    is_last_move = last_move is not None and sq in (last_move.from_square, last_move.to_square)
+    return symbol, is_last_move, sq == selected_square, target
+
+
+def draw_square(sq, state):
+    """Repaint one square: background, highlights, legal-move marker, piece and labels."""
+    symbol, is_last_move, is_selected, target = state
+    rect = square_rect(sq)
+    screen.blit(background, rect, rect)
+
+    # Soft yellow highlights for last move squares
+    if is_last_move:
+        # Lichess-style subtle yellow tint
+        screen.blit(tint_surface((SQUARE_SIZE, SQUARE_SIZE), (246, 246, 130, 100)), rect)
+
+    # Translucent green highlight on the selected piece's square
+    if is_selected:
+        # subtle translucent green
+        screen.blit(tint_surface((SQUARE_SIZE, SQUARE_SIZE), (20, 220, 20, 80)), rect)
+
+    # Small translucent dot or outer ring on legal-move targets
+    if target == 'ring':
+        # Draw a nice outer circle outline if targeting an occupied square
+        pygame.draw.circle(screen, (0, 0, 0), rect.center, SQUARE_SIZE // 2 - 4, 4)
+    elif target == 'dot':
+        # Draw a small dot if targeting an empty square
+        pygame.draw.circle(screen, MOVE_DOT_COLOR, rect.center, 8)
+
+    if symbol in PIECE_IMAGES:
+        screen.blit(PIECE_IMAGES[symbol], (rect.x + PIECE_OFFSET, rect.y + PIECE_OFFSET))
+
+    screen.blit(label_layer, rect, rect)
+
+
+def render_board(current_time, full=False):
+    """
+    Bring the board on screen up to date and return the rects that changed.
+    Skips the piece being dragged or animated on its square and draws it as
+    a free-moving sprite on top instead.
+    """
+    global animating_piece, drawn_sprites, full_redraw
+
+    if background is None:
+        build_background()
+
     possible_targets = (
-        {move.to_square for move in board.legal_moves if move.from_square == selected_square}
+        {move.to_square for move in board.cached_legal_moves_from(selected_square)}
         if selected_square is not None else set()
     )
 
-    for row in range(8):
-        for col in range(8):
-            sq    = chess.square(col, 7 - row)
-            color = COLORS['white'] if (row + col) % 2 == 0 else COLORS['black']
-            rect  = pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
-            pygame.draw.rect(screen, color, rect)
-
-            # Soft yellow highlights for last move squares
-            if last_move is not None and sq in (last_move.from_square, last_move.to_square):
-                highlight_surf = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-                highlight_surf.fill((246, 246, 130, 100)) # Lichess-style subtle yellow tint
-                screen.blit(highlight_surf, (col * SQUARE_SIZE, row * SQUARE_SIZE))
-
-            # Translucent green highlight on the selected piece's square
-            if selected_square is not None:
-                sel_row, sel_col = divmod(selected_square, 8)
-                if row == 7 - sel_row and col == sel_col:
-                    sel_surf = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-                    sel_surf.fill((20, 220, 20, 80)) # subtle translucent green
-                    screen.blit(sel_surf, (col * SQUARE_SIZE, row * SQUARE_SIZE))
-
-            # Small translucent dot or outer ring on legal-move targets
-            if sq in possible_targets:
-                cx = col * SQUARE_SIZE + SQUARE_SIZE // 2
-                cy = row * SQUARE_SIZE + SQUARE_SIZE // 2
-                target_piece = board.piece_at(sq)
-                if target_piece:
-                    # Draw a nice outer circle outline if targeting an occupied square
-                    pygame.draw.circle(screen, (0, 0, 0), (cx, cy), SQUARE_SIZE // 2 - 4, 4)
-                else:
-                    # Draw a small dot if targeting an empty square
-                    pygame.draw.circle(screen, MOVE_DOT_COLOR, (cx, cy), 8)
-
-
-def draw_pieces(current_time):
-    """Draw all pieces; skip the piece being dragged or animated."""
-    global animating_piece
-    
-    anim_progress = 1.0
-    anim_symbol = None
-    anim_to_sq = None
-    
+    piece_map = board.piece_map()
+    hidden  = set()
+    sprites = []   # (symbol, (x, y))
+
     if animating_piece:
         elapsed = current_time - animating_piece['start_time']
         duration = animating_piece['duration']
@@ -132,80 +248,78 @@ def draw_pieces(current_time):
             animating_piece = None
         else:
             anim_progress = elapsed / duration
-            anim_symbol = animating_piece['symbol']
-            anim_to_sq = animating_piece['to_sq']
-            
-    for square, piece in board.piece_map().items():
-        if dragging_piece and square == selected_square:
-            continue
-        # Skip drawing the animating piece at its destination square during animation
-        if animating_piece and square == anim_to_sq and piece.symbol() == anim_symbol:
-            continue
-            
-        row, col = divmod(square, 8)
-        sym = piece.symbol()
-        if sym in PIECE_IMAGES:
-            x = col * SQUARE_SIZE + PIECE_OFFSET
-            y = (7 - row) * SQUARE_SIZE + PIECE_OFFSET
-            screen.blit(PIECE_IMAGES[sym], (x, y))
-            
-    # Draw sliding piece
-    if animating_piece:
-        from_row, from_col = divmod(animating_piece['from_sq'], 8)
-        to_row, to_col = divmod(animating_piece['to_sq'], 8)
-        
-        from_x = from_col * SQUARE_SIZE + PIECE_OFFSET
-        from_y = (7 - from_row) * SQUARE_SIZE + PIECE_OFFSET
-        to_x = to_col * SQUARE_SIZE + PIECE_OFFSET
-        to_y = (7 - to_row) * SQUARE_SIZE + PIECE_OFFSET
-        
-        curr_x = from_x + (to_x - from_x) * anim_progress
-        curr_y = from_y + (to_y - from_y) * anim_progress
-        
-        sym = animating_piece['symbol']
-        if sym in PIECE_IMAGES:
-            screen.blit(PIECE_IMAGES[sym], (int(curr_x), int(curr_y)))
+            from_rect = square_rect(animating_piece['from_sq'])
+            to_rect   = square_rect(animating_piece['to_sq'])
+            curr_x = from_rect.x + (to_rect.x - from_rect.x) * anim_progress + PIECE_OFFSET
+            curr_y = from_rect.y + (to_rect.y - from_rect.y) * anim_progress + PIECE_OFFSET
+
+            # Skip drawing the animating piece at its destination square during animation
+            to_piece = piece_map.get(animating_piece['to_sq'])
+            if to_piece and to_piece.symbol() == animating_piece['symbol']:
+                hidden.add(animating_piece['to_sq'])
+            sprites.append((animating_piece['symbol'], (int(curr_x), int(curr_y))))
 
     # Draw the piece under the cursor while dragging
     if dragging_piece:
-        sym = dragging_piece[2]
+        hidden.add(selected_square)
+        sprites.append((dragging_piece[2], (dragging_piece[0] - PIECE_SIZE // 2,
+                                            dragging_piece[1] - PIECE_SIZE // 2)))
+
+    full = full or full_redraw
+    dirty = set()
+    for sq in chess.SQUARES:
+        state = square_state(sq, piece_map, hidden, possible_targets)
+        if full or drawn_squares.get(sq) != state:
+            drawn_squares[sq] = state
+            dirty.add(sq)
+
+    # Erase the sprites of the last frame and make room for the new ones
+    sprite_rects = [pygame.Rect(pos, (PIECE_SIZE, PIECE_SIZE)) for _, pos in sprites]
+    for rect in drawn_sprites + sprite_rects:
+        dirty.update(squares_under(rect))
+
+    for sq in dirty:
+        draw_square(sq, drawn_squares[sq])
+
+    for (sym, pos), rect in zip(sprites, sprite_rects):
         if sym in PIECE_IMAGES:
-            img = PIECE_IMAGES[sym]
-            screen.blit(img, (
-                dragging_piece[0] - PIECE_SIZE // 2,
-                dragging_piece[1] - PIECE_SIZE // 2
-            ))
+            screen.blit(PIECE_IMAGES[sym], pos)
+            screen.blit(label_layer, rect, rect)
+
+    drawn_sprites = sprite_rects
+    full_redraw = False
+    return [square_rect(sq) for sq in dirty]
 
 
-def draw_labels():
+def draw_labels(surface):
     """Draw file (a-h) and rank (1-8) labels along the edges."""
     for i in range(8):
         # File letters along the bottom
-        col_label = font_small.render(chr(ord('a') + i), True, (120, 120, 120))
-        screen.blit(col_label, (i * SQUARE_SIZE + 4, HEIGHT - 20))
+        col_label = text_surface(font_small, chr(ord('a') + i), (120, 120, 120))
+        surface.blit(col_label, (i * SQUARE_SIZE + 4, HEIGHT - 20))
         # Rank numbers along the left
-        row_label = font_small.render(str(8 - i), True, (120, 120, 120))
-        screen.blit(row_label, (4, i * SQUARE_SIZE + 4))
+        row_label = text_surface(font_small, str(8 - i), (120, 120, 120))
+        surface.blit(row_label, (4, i * SQUARE_SIZE + 4))
 
 
 def display_game_over(mouse_pos):
     """Render the semi-transparent game-over overlay; return button rects."""
     # 1. Semi-transparent full-screen dimming overlay
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((10, 10, 15, 180)) # Dark translucent tint
-    screen.blit(overlay, (0, 0))
+    screen.blit(tint_surface((WIDTH, HEIGHT), (10, 10, 15, 180)), (0, 0)) # Dark translucent tint
 
     # 2. Main Dialog Card
     card_w, card_h = 500, 320
     card_x = (WIDTH - card_w) // 2
     card_y = (HEIGHT - card_h) // 2
 
-    # Draw card background with rounded corners (using alpha)
-    card_surf = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
-    pygame.draw.rect(card_surf, (24, 24, 28, 245), (0, 0, card_w, card_h), border_radius=16)
-    # Draw card border
-    pygame.draw.rect(card_surf, (255, 255, 255, 30), (0, 0, card_w, card_h), width=2, border_radius=16)
-    screen.blit(card_surf, (card_x, card_y))
+    def build_card():
+        # Draw card background with rounded corners (using alpha)
+        card_surf = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
+        pygame.draw.rect(card_surf, (24, 24, 28, 245), (0, 0, card_w, card_h), border_radius=16)
+        # Draw card border
+        pygame.draw.rect(card_surf, (255, 255, 255, 30), (0, 0, card_w, card_h), width=2, border_radius=16)
+        return card_surf
+    screen.blit(cached_surface(('card', card_w, card_h), build_card), (card_x, card_y))
 
     # 3. Title text (Winner status)
     text_color = (255, 255, 255)
@@ -216,24 +330,27 @@ def display_game_over(mouse_pos):
     else:
         text_color = (149, 165, 166) # Silver/Gray for draws
 
-    winner_text = font_large.render(winner.upper(), True, text_color)
-    if winner_text.get_width() > card_w - 40:
-        # Scale down to fit the card width if text is too long (e.g. 50-move rule draws)
-        new_w = card_w - 40
-        new_h = int(winner_text.get_height() * (new_w / winner_text.get_width()))
-        winner_text = pygame.transform.smoothscale(winner_text, (new_w, new_h))
+    def build_winner_text():
+        winner_text = font_large.render(winner.upper(), True, text_color)
+        if winner_text.get_width() > card_w - 40:
+            # Scale down to fit the card width if text is too long (e.g. 50-move rule draws)
+            new_w = card_w - 40
+            new_h = int(winner_text.get_height() * (new_w / winner_text.get_width()))
+            winner_text = pygame.transform.smoothscale(winner_text, (new_w, new_h))
+        return winner_text
+    winner_text = cached_surface(('winner', winner, text_color, card_w), build_winner_text)
 
     winner_rect = winner_text.get_rect(center=(WIDTH // 2, card_y + 60))
     screen.blit(winner_text, winner_rect)
 
     # 4. Buttons
     # Play Again Button
-    play_again_text = font_medium.render("PLAY AGAIN", True, (255, 255, 255))
+    play_again_text = text_surface(font_medium, "PLAY AGAIN", (255, 255, 255))
     play_again_rect = play_again_text.get_rect(center=(WIDTH // 2, card_y + 160))
     play_again_btn_rect = play_again_rect.inflate(60, 20)
 
     # Quit Button
-    quit_text = font_medium.render("QUIT", True, (255, 255, 255))
+    quit_text = text_surface(font_medium, "QUIT", (255, 255, 255))
     quit_rect = quit_text.get_rect(center=(WIDTH // 2, card_y + 240))
     quit_btn_rect = quit_rect.inflate(60, 20)
 
@@ -267,28 +384,32 @@ def display_game_over(mouse_pos):
 # Game logic
 # ---------------------------------------------
 
-def evaluate_board():
+def evaluate_board(board):
     """
     Positive = White (player) advantage.
     The AI (Black) wants to minimise this, i.e. play the *worst* move for itself.
     """
-    piece_value = {
-        chess.PAWN: 1, chess.KNIGHT: 3, chess.BISHOP: 3,
-        chess.ROOK: 5, chess.QUEEN: 9, chess.KING: 1000
-    }
-    score = 0
-    for square, piece in board.piece_map().items():
-        value  = piece_value[piece.piece_type]
-        score += value if piece.color == chess.WHITE else -value
-    return score
+    return board.material
 
 
-async def get_losing_move():
+def get_losing_move(board):
     """
     Pick the move that makes the AI (Black) position as bad as possible,
     i.e. gives the human (White) the maximum advantage.
+
+    A generator that yields between steps of the search, so it can be run
+    in a worker or time-sliced; the move is its StopIteration value.
     """
-    legal_moves = list(board.legal_moves)
+    if book is not None and board.ply() < BOOK_MAX_PLY:
+        try:
+            return book.weighted_choice(board).move
+        except IndexError:
+            pass   # out of book
+
+    if anti_engine is not None:
+        return (yield from anti_engine.iter_search(board))
+
+    legal_moves = board.cached_legal_moves()
     if not legal_moves:
         return None
 
@@ -301,7 +422,7 @@ async def get_losing_move():
 
         board.push(move)
 
-        score = evaluate_board()
+        score = evaluate_board(board)
 
         # Reward self-captures (AI giving up material is good for the "loser" bot)
         if is_capture:
@@ -314,9 +435,7 @@ async def get_losing_move():
             score += 200         # AI checkmated White -> the worst possible outcome for a losing bot
 
         # Penalise positions where White CAN capture next turn (those are good for the losing bot)
-        for response in board.legal_moves:
-            if board.is_capture(response):
-                score -= 15
+        score -= 15 * board.count_legal_captures()
 
         board.pop()
 
@@ -324,15 +443,74 @@ async def get_losing_move():
             worst_score = score
             worst_move  = move
             
-        await asyncio.sleep(0) # Keep async loop responsive during heavy evaluation
+        yield
 
     return worst_move or legal_moves[0]
 
 
+def run_to_completion(steps):
+    """Run a search generator in one go (worker thread)."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+async def run_time_sliced(steps):
+    """Run a search generator for AI_TIME_SLICE_MS per frame (Emscripten)."""
+    while True:
+        deadline = time.monotonic() + AI_TIME_SLICE_MS / 1000.0
+        try:
+            while time.monotonic() < deadline:
+                next(steps)
+        except StopIteration as stop:
+            return stop.value
+        await asyncio.sleep(0)
+
+
+def start_ai_search():
+    """Start searching the AI reply in the background and return its future."""
+    # The search works on its own copy, so the board can be drawn meanwhile
+    steps = get_losing_move(board.copy(stack=False))
+    if ai_executor is None:
+        return asyncio.ensure_future(run_time_sliced(steps))
+    return asyncio.get_running_loop().run_in_executor(ai_executor, run_to_completion, steps)
+
+
+def play_ai_move(ai_move):
+    global animating_piece, last_move
+    is_capture_ai = board.is_capture(ai_move)
+    piece_symbol_ai = board.piece_at(ai_move.from_square).symbol()
+    animating_piece = {
+        'from_sq': ai_move.from_square,
+        'to_sq': ai_move.to_square,
+        'symbol': piece_symbol_ai,
+        'start_time': pygame.time.get_ticks(),
+        'duration': 150
+    }
+    last_move = ai_move
+    san_ai = board.san(ai_move)
+    board.push(ai_move)
+    
+    if platform.system() == "Emscripten":
+        try:
+            platform.window.addMove(san_ai)
+        except Exception:
+            pass
+            
+    play_move_sound(is_capture_ai)
+    update_captured_js()
+    check_game_over()
+
+
 def check_game_over():
     global game_over, winner
 
-    if board.is_checkmate():
+    status = board.game_status(claim_draw=True)
+    termination = status.outcome.termination if status.outcome else None
+
+    if status.is_checkmate:
         # board.turn is the side that HAS been checkmated (they're to move but can't)
         if board.turn == chess.BLACK:
             winner = "YOU WIN!"      # Black (AI) checkmated -> player wins
@@ -340,16 +518,16 @@ def check_game_over():
             winner = "YOU LOSE!"     # White (player) checkmated
         game_over = True
 
-    elif board.is_stalemate():
+    elif status.is_stalemate:
         winner    = "DRAW (Stalemate)!"
         game_over = True
-    elif board.is_insufficient_material():
+    elif termination == chess.Termination.INSUFFICIENT_MATERIAL:
         winner    = "DRAW (Insufficient Material)!"
         game_over = True
-    elif board.can_claim_threefold_repetition():
+    elif termination in (chess.Termination.THREEFOLD_REPETITION, chess.Termination.FIVEFOLD_REPETITION):
         winner    = "DRAW (Threefold Repetition)!"
         game_over = True
-    elif board.can_claim_fifty_moves():
+    elif termination in (chess.Termination.FIFTY_MOVES, chess.Termination.SEVENTYFIVE_MOVES):
         winner    = "DRAW (50-Move Rule)!"
         game_over = True
 
@@ -388,10 +566,12 @@ def update_captured_js():
 
 
 def play_move_sound(is_capture):
-    if board.is_checkmate():
+    # Shares the cached status with check_game_over()
+    status = board.game_status(claim_draw=True)
+    if status.is_checkmate:
         if mate_sound:
             mate_sound.play()
-    elif board.is_check():
+    elif status.is_check:
         if check_sound:
             check_sound.play()
     elif is_capture:
@@ -404,13 +584,17 @@ def play_move_sound(is_capture):
 
 def reset_game():
     global board, game_over, winner, selected_square, dragging_piece, last_move, animating_piece
-    board           = chess.Board()
+    global full_redraw, overlay_hover
+    board           = LoserBoard()
+    board.track_repetitions()
     game_over       = False
     winner          = ""
     selected_square = None
     dragging_piece  = None
     last_move       = None
     animating_piece = None
+    full_redraw     = True    # wipe the game-over overlay
+    overlay_hover   = None
     
     if platform.system() == "Emscripten":
         try:
@@ -429,6 +613,7 @@ quit_rect_cached       = None
 
 async def main():
     global play_again_rect_cached, quit_rect_cached, selected_square, dragging_piece
+    global full_redraw, overlay_hover, ai_future, ai_move_due
     running = True
     while running:
         clock.tick(FPS)
@@ -436,6 +621,9 @@ async def main():
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+
+            elif event.type == pygame.VIDEOEXPOSE:
+                full_redraw = True
     
             elif game_over:
                 # FIX #4: only hit-test here; rendering happens once per frame below
@@ -444,6 +632,10 @@ async def main():
                         reset_game()
                     elif quit_rect_cached.collidepoint(event.pos):
                         running = False
+
+            elif ai_future is not None:
+                # Ignore input while the AI is thinking, its reply comes next
+                pass
     
             else:
                 if event.type == pygame.MOUSEBUTTONDOWN:
@@ -469,7 +661,7 @@ async def main():
                             and chess.square_rank(target_square) in (0, 7)):
                         move = chess.Move(selected_square, target_square, promotion=chess.QUEEN)
     
-                    if move in board.legal_moves:
+                    if move in board.cached_legal_moves_from(selected_square):
                         is_capture = board.is_capture(move)   # check BEFORE push
                         piece_symbol = board.piece_at(selected_square).symbol()
                         
@@ -498,51 +690,43 @@ async def main():
                         check_game_over()
     
                         if not game_over:
-                            # Use asyncio.sleep instead of pygame.time.delay so browser doesn't freeze
-                            await asyncio.sleep(AI_MOVE_DELAY_MS / 1000.0)
-                            ai_move = await get_losing_move()
-                            if ai_move:
-                                is_capture_ai = board.is_capture(ai_move)
-                                piece_symbol_ai = board.piece_at(ai_move.from_square).symbol()
-                                animating_piece = {
-                                    'from_sq': ai_move.from_square,
-                                    'to_sq': ai_move.to_square,
-                                    'symbol': piece_symbol_ai,
-                                    'start_time': pygame.time.get_ticks(),
-                                    'duration': 150
-                                }
-                                last_move = ai_move
-                                san_ai = board.san(ai_move)
-                                board.push(ai_move)
-                                
-                                if platform.system() == "Emscripten":
-                                    try:
-                                        platform.window.addMove(san_ai)
-                                    except Exception:
-                                        pass
-                                        
-                                play_move_sound(is_capture_ai)
-                                update_captured_js()
-                                check_game_over()
+                            # The reply is searched while the board keeps rendering
+                            ai_future   = start_ai_search()
+                            ai_move_due = pygame.time.get_ticks() + AI_MOVE_DELAY_MS
     
                     selected_square = None
                     dragging_piece  = None
     
-        # Render
-        screen.fill((0, 0, 0))
- 
-        draw_board()
-        draw_pieces(pygame.time.get_ticks())
-        draw_labels()
+        # Play the AI reply once it is ready and the delay has passed
+        if ai_future is not None and ai_future.done() and pygame.time.get_ticks() >= ai_move_due:
+            ai_move   = ai_future.result()
+            ai_future = None
+            if ai_move:
+                play_ai_move(ai_move)
+
+        # Render only what changed since the last frame
+        dirty_rects = render_board(pygame.time.get_ticks())
  
         if game_over:
-            # FIX #4: render overlay once per frame, cache button rects
             mouse_pos = pygame.mouse.get_pos()
-            play_again_rect_cached, quit_rect_cached = display_game_over(mouse_pos)
+            hover = tuple(bool(rect and rect.collidepoint(mouse_pos))
+                          for rect in (play_again_rect_cached, quit_rect_cached))
+            if dirty_rects or hover != overlay_hover:
+                # The overlay is translucent, so it is only ever blended over a
+                # freshly painted board, and only when it looks different.
+                # FIX #4: cache button rects for hit-testing
+                render_board(pygame.time.get_ticks(), full=True)
+                play_again_rect_cached, quit_rect_cached = display_game_over(mouse_pos)
+                overlay_hover = tuple(bool(rect.collidepoint(mouse_pos))
+                                      for rect in (play_again_rect_cached, quit_rect_cached))
+                dirty_rects = [screen.get_rect()]
             
-        pygame.display.flip()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
         await asyncio.sleep(0)
 
+    if ai_executor is not None:
+        ai_executor.shutdown(wait=False, cancel_futures=True)
     pygame.quit()
 
 if __name__ == "__main__":